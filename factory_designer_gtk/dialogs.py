@@ -10,17 +10,18 @@ from satisfactory.base import (
     BuildingType,
     Component,
     Connection,
-    Conveyance,
     ConveyanceType,
     Input,
     Output,
-    ResourceNode,
 )
-from satisfactory.buildings import Miner
 from satisfactory.factories import Factory
 from typing import Callable
 
 
+# Dummy instances of every conveyance, built once on first use so we can get at their properties
+CONVEYANCE_INSTANCES = None
+
+
 class ConfirmOrCancelWindow(Gtk.MessageDialog):
     '''
     Creates a dialog window to show when a user is about to take a destructive action, confirming
@@ -87,6 +88,18 @@ class ConnectionManagementWindowResponse(object):
     the outcome of the user's interaction with it.
     '''
 
+    __slots__ = (
+        'changed',
+        'source_component_id',
+        'source_connection_index',
+        'source_connection_is_output',
+        'target_component_id',
+        'target_connection_index',
+        'old_target_component_id',
+        'old_target_connection_index',
+        'conveyance_class',
+    )
+
     def __init__(self,
         changed: bool,
         source_component_id: str = None,
@@ -182,7 +195,7 @@ class ConnectionManagementWindow(Gtk.Window):
             # The active conveyance is only set if the connection is connected to a conveyance
             closest_comp, closest_conn, closest_conn_id = \
                 self.connection.connected_to()
-            if closest_comp is not None and issubclass(closest_comp.__class__, Conveyance):
+            if closest_comp is not None and closest_comp.is_conveyance:
                 active_conveyance = closest_comp.__class__.__name__
 
         # Update all the widgets appropriately
@@ -355,13 +368,16 @@ class ConnectionManagementWindow(Gtk.Window):
         is between a Miner and Resource Node, these options are not presented to the user.
         '''
 
-        if (issubclass(self.component.__class__, Miner) and self.connection.is_input()) \
-            or isinstance(self.component, ResourceNode):
+        if (self.component.is_miner and self.connection.is_input()) \
+            or self.component.is_resource_node:
                 self.boxConveyance.set_visible(False)
                 self.cboConveyance.set_active_id(None)
         else:
             # Create dummy instances of the conveyances so we can get at their properties
-            all_conveyances = [ conv() for conv in conveyances.get_all() ]
+            global CONVEYANCE_INSTANCES
+            if CONVEYANCE_INSTANCES is None:
+                CONVEYANCE_INSTANCES = [ conv() for conv in conveyances.get_all() ]
+            all_conveyances = CONVEYANCE_INSTANCES
 
             # Filter by type
             compatible_conveyances = [ conv for conv in all_conveyances
@@ -14,10 +14,8 @@ from satisfactory.base import (
     Component,
     Conveyance,
     ConveyanceType,
-    InfiniteSupplyNode,
     ResourceNode,
 )
-from satisfactory.buildings import Miner
 from satisfactory.factories import Factory
 from factory_designer_gtk.geometry import (
     sizes,
@@ -30,6 +28,8 @@ from factory_designer_gtk.geometry import (
 
 
 BASE_IMAGE_FILE_PATH = './static/images'
+CANVAS_INDEX_CELL_SIZE = 512  # Width and height in canvas units of each cell in the visibility grid
+HIT_INDEX_CELL_SIZE = 128  # Width and height in pixels of each cell in the hit-testing grid
 FIRST_RUN=True
 
 COLORS = {
@@ -57,6 +57,18 @@ class Blueprint(object):
         - line_color: A string describing the color of flow lines in the foreground
     '''
 
+    # Grid of on-screen component bounds used for hit-testing, built on demand. It's derived from
+    # the geometry, so it is never saved, and blueprints saved without it fall back to this.
+    hit_index = None
+
+    # Grid of the canvas area each component covers, used to find the visible ones, built on demand.
+    # Canvas locations don't change when the viewport does, so it survives panning and zooming.
+    canvas_index = None
+
+    # Render nodes for each component's drawing, relative to its background, keyed by component ID.
+    # Like the hit index, they're never saved, and blueprints saved without them fall back to this.
+    component_nodes = None
+
     def __init__(self,
         factory: Factory = Factory(),
         background_color: str = '#7171ad',
@@ -122,8 +134,10 @@ class Blueprint(object):
             - filename: Path to the file to load
         '''
 
+        # Read the whole file in one go and unpickle it from memory rather than letting pickle pull
+        # it through the file object in many small reads
         with open(filename, 'rb') as fh:
-            blueprint = pickle.load(fh)
+            blueprint = pickle.loads(fh.read())
         return blueprint
 
     def save(self,
@@ -138,8 +152,43 @@ class Blueprint(object):
         with open(filename, 'wb') as fh:
             pickle.dump(self, fh, pickle.HIGHEST_PROTOCOL)
 
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state.pop('hit_index', None)
+        state.pop('canvas_index', None)
+        state.pop('component_nodes', None)
+        return state
+
     def invalidate_geometry(self):
         self.__invalid_geo = True
+        self.hit_index = None
+        self.canvas_index = None
+
+    def pan(self,
+        location: Coordinate2D
+    ):
+        '''
+        Moves the viewport to a new location within the blueprint. The scale doesn't change, so
+        every component moves on screen by the same number of pixels; their geometry is shifted by
+        that much rather than being recalculated from scratch. Only the conveyances, whose paths
+        depend on where their endpoints are, get recalculated.
+
+            - location: The new location of the top-left corner of the viewport
+        '''
+
+        scale = self.viewport.scale
+        previous = self.viewport.region.location
+        shift_x = round(previous.x * scale) - round(location.x * scale)
+        shift_y = round(previous.y * scale) - round(location.y * scale)
+        self.viewport.region.location = location
+
+        for geometry in self.geometry.values():
+            if isinstance(geometry, ComponentGeometry) and geometry.label is not None:
+                geometry.shift(shift_x, shift_y)
+        for geometry in self.geometry.values():
+            if isinstance(geometry, ConveyanceGeometry) and geometry.geometry is not None:
+                geometry.calculate(scale=scale)
+        self.hit_index = None
 
     def add_component(self,
         component: Component,
@@ -169,16 +218,36 @@ class Blueprint(object):
                 )
         else:
             self.geometry[component.id] = ComponentGeometry(component, canvas_location)
+        self.hit_index = None
+        self.canvas_index = None
 
     def remove_component(self,
         component_id: str
     ):
         if component_id in self.geometry:
             del self.geometry[component_id]
+        if self.component_nodes:
+            self.component_nodes.pop(component_id, None)
 
         self.factory.remove(component_id=component_id)
         self.invalidate_geometry()
 
+    def remove_components(self,
+        component_ids: set[str]
+    ):
+        '''
+        Removes several components from the factory at once, walking the factory's components only
+        one time instead of once per component.
+        '''
+
+        for component_id in component_ids:
+            self.geometry.pop(component_id, None)
+            if self.component_nodes:
+                self.component_nodes.pop(component_id, None)
+
+        self.factory.remove_many(component_ids)
+        self.invalidate_geometry()
+
     def draw_widget_background(self,
         snapshot: Gdk.Snapshot,
         background_color: Gdk.RGBA = None
@@ -208,14 +277,53 @@ class Blueprint(object):
     ):
         '''
         Draws a graphical representation of a factory component on the screen.
+
+        A component looks the same wherever it sits, so its drawing is recorded once as a render
+        node relative to its background and placed wherever the component is. It's only drawn again
+        when something that changes its appearance does, which is everything in the key below.
         '''
 
-        self.draw_component_background(widget, snapshot, component, geometry, self.viewport.scale)
-        self.draw_component_icon(widget, snapshot, component, geometry, self.viewport.scale)
-        self.draw_component_badges(widget, snapshot, component, geometry, self.viewport.scale)
-        self.draw_component_label(widget, snapshot, component, geometry, self.viewport.scale)
-        self.draw_component_inputs(widget, snapshot, component, geometry, self.viewport.scale)
-        self.draw_component_outputs(widget, snapshot, component, geometry, self.viewport.scale)
+        scale = self.viewport.scale
+        key = (
+            scale,
+            component is self.selected,
+            component.name,
+            component.item if component.is_resource_node else None,
+            tuple(geometry.badges),
+            len(geometry.inputs),
+            len(geometry.outputs),
+        )
+        if self.component_nodes is None:
+            self.component_nodes = {}
+        cached = self.component_nodes.get(component.id)
+
+        origin = Graphene.Point()
+        origin.x = geometry.background.left
+        origin.y = geometry.background.top
+
+        if cached and cached[0] == key:
+            node = cached[1]
+        else:
+            # Record the component as though its background sat at the origin
+            component_snapshot = Gtk.Snapshot.new()
+            offset = Graphene.Point()
+            offset.x = -origin.x
+            offset.y = -origin.y
+            component_snapshot.translate(offset)
+            self.draw_component_background(widget, component_snapshot, component, geometry, scale)
+            self.draw_component_icon(widget, component_snapshot, component, geometry, scale)
+            self.draw_component_badges(widget, component_snapshot, component, geometry, scale)
+            self.draw_component_label(widget, component_snapshot, component, geometry, scale)
+            self.draw_component_inputs(widget, component_snapshot, component, geometry, scale)
+            self.draw_component_outputs(widget, component_snapshot, component, geometry, scale)
+            node = component_snapshot.to_node()
+            self.component_nodes[component.id] = (key, node)
+
+        if node:
+            snapshot.save()
+            snapshot.translate(origin)
+            snapshot.append_node(node)
+            snapshot.restore()
 
     def draw_component_background(self,
         widget: Gtk.Widget,
@@ -271,21 +379,20 @@ class Blueprint(object):
         Draws only the component's badges
         '''
 
-        # Load up the badge textures
-        for badge in geometry.badges.keys():
+        for badge, badge_region in geometry.badges.items():
+            # Load up the badge texture
             badge_texture = widget.get_texture('badges', badge)
             if not badge_texture:
                 badge_filename = f'{BASE_IMAGE_FILE_PATH}/badges/{badge}.svg'
                 badge_texture = widget.load_texture(badge_filename, 'badges', badge)
 
-        # And then draw the badges
-        for badge, badge_region in geometry.badges.items():
+            # And then draw the badge
             badge_rect = Graphene.Rect()
             badge_rect.init(
                 badge_region.left, badge_region.top,
                 badge_region.width, badge_region.height)
             snapshot.append_scaled_texture(
-                widget.get_texture('badges', badge),
+                badge_texture,
                 Gsk.ScalingFilter.TRILINEAR,
                 badge_rect)
 
@@ -300,15 +407,17 @@ class Blueprint(object):
         Draws only the icon portion of a component
         '''
 
-        # Load up the component icon texture
-        icon_key = None
-        if type(component) in [InfiniteSupplyNode, ResourceNode]:
-            icon_key = component.item.programmatic_name()
+        # Load up the component icon texture. Icons are cached by the component's class, or by the
+        # item for nodes, so finding one each frame doesn't mean building and hashing a name.
+        if component.is_resource_node:
+            icon_key = component.item
         else:
-            icon_key = component.__class__.__name__
+            icon_key = component.__class__
         icon_texture = widget.get_texture('components', icon_key)
         if not icon_texture:
-            filename = f'{BASE_IMAGE_FILE_PATH}/components/{icon_key}.png'
+            icon_name = icon_key.__name__ if isinstance(icon_key, type) \
+                else icon_key.programmatic_name()
+            filename = f'{BASE_IMAGE_FILE_PATH}/components/{icon_name}.png'
             icon_texture = widget.load_texture(filename, 'components', icon_key)
 
         # Draw the icon
@@ -487,8 +596,9 @@ class Blueprint(object):
             geometry.bounds.width,
             geometry.bounds.height
         )
-        path = Gsk.Path.parse(geometry.path_str)
-        snapshot.push_stroke(path, stroke)
+        if geometry.path is None:
+            geometry.path = Gsk.Path.parse(geometry.path_str)
+        snapshot.push_stroke(geometry.path, stroke)
         snapshot.append_color(line_color, bounds)
         snapshot.pop()
 
@@ -524,9 +634,13 @@ class Blueprint(object):
     def draw_frame(self,
         widget: Gtk.Widget,
         snapshot: Gtk.Snapshot,
+        skip: set[str] = None,
     ):
         '''
         Draws a single frame of the contents of the viewport.
+
+            - skip: IDs of components and conveyances to leave out of the frame, such as the ones
+                being dragged, which are drawn on top of it separately by `draw_grabbed`.
         '''
 
         global FIRST_RUN
@@ -535,34 +649,41 @@ class Blueprint(object):
             logging.debug('Draws are locked; refusing to draw a frame right now')
             return
 
-        # Make sure the components have geometry
+        if skip is None:
+            skip = set()
+
+        # The viewport doesn't change while a frame is drawn, so read it once for every component
+        scale = self.viewport.scale
+        translate = self.viewport.region.location
+
+        # Make sure the components have geometry, noting whether any of it had to be calculated
+        recalculated = False
         for id, geometry in self.geometry.items():
             component = self.factory.get_component_by_id(id)
             # Conveyances are special; exclude them here
-            if not isinstance(component, Conveyance):
-                label = PangoTextLabel(
-                    component.name,
-                    self.label_font_family,
-                    self.label_font_size,
-                    widget,
-                    self.viewport.scale)
-                # Always generate geometry if we haven't already or if it's been marked as invalid
-                if FIRST_RUN or self.__invalid_geo:
-                    geometry.calculate(
-                        *label.layout.get_pixel_size(),
-                        scale=self.viewport.scale,
-                        translate=self.viewport.region.location)
-                # Otherwise, generate geometry if we lack any of these calculations
-                elif not geometry.background \
+            if not component.is_conveyance:
+                # Always generate geometry if we haven't already or if it's been marked as invalid.
+                # Otherwise, generate geometry if we lack any of these calculations. A component
+                # with no inputs or outputs has empty lists for those, which still count as done.
+                # Laying out the label is only worth doing when the geometry gets generated.
+                if FIRST_RUN or self.__invalid_geo \
+                    or not geometry.background \
                     or not geometry.badges \
                     or not geometry.icon \
-                    or not geometry.inputs \
+                    or geometry.inputs is None \
                     or not geometry.label \
-                    or not geometry.outputs:
+                    or geometry.outputs is None:
+                        label = PangoTextLabel(
+                            component.name,
+                            self.label_font_family,
+                            self.label_font_size,
+                            widget,
+                            scale)
                         geometry.calculate(
                             *label.layout.get_pixel_size(),
-                            scale=self.viewport.scale,
-                            translate=self.viewport.region.location)
+                            scale=scale,
+                            translate=translate)
+                        recalculated = True
 
         # Fill the background first; everything else gets drawn on top
         self.draw_widget_background(snapshot=snapshot)
@@ -571,72 +692,109 @@ class Blueprint(object):
         visible_component_geometry = self.get_visible_component_geometry()
         visible_components = [component[0] for component in visible_component_geometry]
 
-        # Determine if any components which are offscreen are attached to any onscreen components.
-        # If so, we'll need to include them in the drawing so we can later draw the conveyance.
-        # NOTE: Do we actually have to do this? We build the geometry for everything, and that
-        # should be all we need. Maybe we can delete this code.
-        offscreen_components = self.get_offscreen_component_geometry(visible_components)
-
-        # Draw those components
+        # Draw those components. Geometry is built for every component, including offscreen ones
+        # attached to onscreen conveyances, so nothing offscreen needs to be drawn.
         for component, geometry in visible_component_geometry:
-            self.draw_component(widget, snapshot, component, geometry, label)
+            if component.id not in skip:
+                self.draw_component(widget, snapshot, component, geometry, None)
 
         # Make sure the conveyances have geometry
         for id, geometry in self.geometry.items():
             conveyance = self.factory.get_component_by_id(id)
-            if isinstance(conveyance, Conveyance):
+            if conveyance.is_conveyance:
                 # Only worry about drawing a conveyance if it's attached to something visible
                 if geometry.source_comp and geometry.target_comp:
-                    label_text = conveyance.name
-                    label = PangoTextLabel(
-                        label_text,
-                        self.conveyance_font_family,
-                        self.conveyance_font_size,
-                        widget,
-                        self.viewport.scale)
                     # Same as before, always generate geometry on the first run and if anything is
                     # invalidated. Otherwise, generate it if some piece of data is missing.
-                    if FIRST_RUN or self.__invalid_geo:
-                        geometry.calculate(
-                            *label.layout.get_pixel_size(),
-                            self.viewport.scale)
-                    elif geometry.geometry is None:
+                    if FIRST_RUN or self.__invalid_geo or geometry.geometry is None:
+                        label = PangoTextLabel(
+                            conveyance.name,
+                            self.conveyance_font_family,
+                            self.conveyance_font_size,
+                            widget,
+                            scale)
                         geometry.calculate(
                             *label.layout.get_pixel_size(),
-                            self.viewport.scale)
+                            scale)
+                        recalculated = True
 
         # Determine which conveyances are visible and draw them
         visible_conveyances = self.get_conveyances_from_components(visible_components)
         for component in visible_conveyances:
-            if isinstance(component, Conveyance):
+            if component.is_conveyance and component.id not in skip:
                 geometry = self.geometry.get(component.id)
                 label_text = component.name
                 self.draw_conveyance(widget, snapshot, component, geometry, label_text)
 
-        # Resource nodes can only connect to miners, but they don't use conveyances to do so. To
-        # keep the blueprint visually consistent, we draw a line between a node and its miner the
-        # same way we draw conveyances. Here we create a fake conveyance for each resource-node-to-
-        # miner connection in the frame.
+        # Draw the links between resource nodes and their miners
         for node in [ component for component in visible_components \
-            if isinstance(component, ResourceNode) ]:
-                if node.outputs[0].target and node.outputs[0].target.attached_to:
-                    target = node.outputs[0].target.attached_to
-                    if isinstance(target, Miner):
-                        node_conveyance = Conveyance(ConveyanceType.RESOURCE_NODE)
-                        node_conv_geo = ConveyanceGeometry(
-                            conveyance=node_conveyance,
-                            source_comp=node,
-                            source_geo=self.geometry[node.id],
-                            source_output=0,
-                            target_comp=target,
-                            target_geo=self.geometry[target.id],
-                            target_input=0)
-                        node_conv_geo.calculate(scale=self.viewport.scale)
-                        self.draw_conveyance(widget, snapshot, None, node_conv_geo, '')
-
-        # Clear out these flags since we've just generated all this geometry
+            if component.is_resource_node ]:
+                self.draw_resource_node_link(widget, snapshot, node, skip)
+
+        # Clear out these flags since we've just generated all this geometry. If any components or
+        # conveyances were recalculated, they may have moved on screen, so the hit-testing grid gets
+        # rebuilt the next time it's needed.
         if FIRST_RUN: FIRST_RUN = False
         self.__invalid_geo = False
+        if recalculated:
+            self.hit_index = None
+
+    def draw_grabbed(self,
+        widget: Gtk.Widget,
+        snapshot: Gtk.Snapshot,
+        component: Component,
+        conveyance_geometries: list[ConveyanceGeometry],
+    ):
+        '''
+        Draws only a component which is being dragged, along with the conveyances attached to it.
+        This goes on top of a frame drawn by `draw_frame` which skipped those same things.
+        '''
+
+        if self.draw_locked:
+            return
+
+        self.draw_component(widget, snapshot, component, self.geometry[component.id], None)
+        for geometry in conveyance_geometries:
+            self.draw_conveyance(
+                widget, snapshot, geometry.conveyance, geometry, geometry.conveyance.name)
+
+        # The link between a resource node and its miner moves with whichever of them is dragged
+        if component.is_resource_node:
+            self.draw_resource_node_link(widget, snapshot, component)
+        elif component.is_miner and component.inputs[0].source:
+            node = component.inputs[0].source.attached_to
+            if node.is_resource_node:
+                self.draw_resource_node_link(widget, snapshot, node)
+
+    def draw_resource_node_link(self,
+        widget: Gtk.Widget,
+        snapshot: Gtk.Snapshot,
+        node: ResourceNode,
+        skip: set[str] = None,
+    ):
+        '''
+        Resource nodes can only connect to miners, but they don't use conveyances to do so. To keep
+        the blueprint visually consistent, we draw a line between a node and its miner the same way
+        we draw conveyances, using a fake conveyance for the connection. Nothing is drawn if either
+        end of the link is in `skip`.
+        '''
+
+        if node.outputs[0].target and node.outputs[0].target.attached_to:
+            target = node.outputs[0].target.attached_to
+            if target.is_miner:
+                if skip and (node.id in skip or target.id in skip):
+                    return
+                node_conveyance = Conveyance(ConveyanceType.RESOURCE_NODE)
+                node_conv_geo = ConveyanceGeometry(
+                    conveyance=node_conveyance,
+                    source_comp=node,
+                    source_geo=self.geometry[node.id],
+                    source_output=0,
+                    target_comp=target,
+                    target_geo=self.geometry[target.id],
+                    target_input=0)
+                node_conv_geo.calculate(scale=self.viewport.scale)
+                self.draw_conveyance(widget, snapshot, None, node_conv_geo, '')
 
     def get_visible_component_geometry(self) -> list[tuple]:
         '''
@@ -647,22 +805,33 @@ class Blueprint(object):
         viewport and must be drawn when updating the widget.
         '''
 
-        # Filter out conveyances and components without coordinate mappings
-        drawable_components = [ (component, self.geometry[component.id]) \
-            for component in self.factory.components
-            if component.id in self.geometry.keys()
-            and not isinstance(component, Conveyance) ]
+        if self.canvas_index is None:
+            self.build_canvas_index()
 
-        # Find components which are visible based on canvas location and size
         canvas_region = self.viewport.get_visible_canvas_region()
-        visible_components = []
-        for component, geometry in drawable_components:
-            if (geometry.canvas_location.x + sizes['component_x'] >= canvas_region.left
-                and geometry.canvas_location.y + sizes['component_y'] >= canvas_region.top) \
-            and (geometry.canvas_location.x <= canvas_region.right
-                and geometry.canvas_location.y <= canvas_region.top + canvas_region.height):
-                    visible_components.append((component, geometry))
-        return visible_components
+        left = canvas_region.left
+        top = canvas_region.top
+        right = canvas_region.right
+        bottom = canvas_region.top + canvas_region.height
+
+        # Only components sharing a cell with the viewport can be visible, so check just those, by
+        # canvas location and size. A component covering several of those cells is found in each.
+        visible_components = {}
+        for cell_x in range(int(left // CANVAS_INDEX_CELL_SIZE),
+            int(right // CANVAS_INDEX_CELL_SIZE) + 1):
+            for cell_y in range(int(top // CANVAS_INDEX_CELL_SIZE),
+                int(bottom // CANVAS_INDEX_CELL_SIZE) + 1):
+                for position, component, geometry in self.canvas_index.get((cell_x, cell_y), ()):
+                    if position in visible_components:
+                        continue
+                    if (geometry.canvas_location.x + sizes['component_x'] >= left
+                        and geometry.canvas_location.y + sizes['component_y'] >= top) \
+                    and (geometry.canvas_location.x <= right
+                        and geometry.canvas_location.y <= bottom):
+                            visible_components[position] = (component, geometry)
+
+        # Keep the factory's order so overlapping components stack the same way every frame
+        return [ visible_components[position] for position in sorted(visible_components) ]
 
     def get_offscreen_component_geometry(self, visible_components) -> list[tuple]:
         '''
@@ -684,22 +853,22 @@ class Blueprint(object):
                 for input in component.inputs:
                     if input.source:
                         input_attachment = input.source.attached_to
-                        if isinstance(input_attachment, Conveyance):
+                        if input_attachment.is_conveyance:
                             if input_attachment.inputs[0].source:
                                 input_attachment = input_attachment.inputs[0].source.attached_to
                                 if input_attachment not in visible_components:
-                                    if input_attachment.id in self.geometry.keys():
+                                    if input_attachment.id in self.geometry:
                                         offscreen_components.append((input_attachment,
                                             self.geometry.get(input_attachment.id)))
                 # Do the same checks but for this component's outputs
                 for output in component.outputs:
                     if output.target:
                         output_attachment = output.target.attached_to
-                        if isinstance(output_attachment, Conveyance):
+                        if output_attachment.is_conveyance:
                             if output_attachment.outputs[0].target:
                                 output_attachment = output_attachment.outputs[0].target.attached_to
                                 if output_attachment not in visible_components:
-                                    if output_attachment.id in self.geometry.keys():
+                                    if output_attachment.id in self.geometry:
                                         offscreen_components.append((output_attachment,
                                             self.geometry.get(output_attachment.id)))
         return offscreen_components
@@ -711,17 +880,17 @@ class Blueprint(object):
 
         conveyances = []
         for component in components:
-            if isinstance(component, Conveyance):
+            if component.is_conveyance:
                 conveyances.append(component)
             if len(component.inputs) > 0:
                 for input in component.inputs:
                     conn_component, *_ = input.connected_to()
-                    if isinstance(conn_component, Conveyance):
+                    if conn_component and conn_component.is_conveyance:
                         conveyances.append(conn_component)
             if len(component.outputs) > 0:
                 for output in component.outputs:
                     conn_component, *_ = output.connected_to()
-                    if isinstance(conn_component, Conveyance):
+                    if conn_component and conn_component.is_conveyance:
                         conveyances.append(conn_component)
         return conveyances
 
@@ -736,6 +905,55 @@ class Blueprint(object):
 
         return self.coordinateMap.get(component.id, Coordinate2D())
 
+    def build_canvas_index(self):
+        '''
+        Sorts every drawable component into a grid of square cells by the area it covers on the
+        canvas, so that finding the visible components only means checking the cells the viewport
+        covers. Each entry notes the component's place in the factory, so the visible ones can be
+        drawn in the factory's order. Conveyances, and components without geometry, are left out.
+        '''
+
+        index = {}
+        for position, component in enumerate(self.factory.components):
+            if component.is_conveyance:
+                continue
+            geometry = self.geometry.get(component.id)
+            if geometry is None:
+                continue
+            location = geometry.canvas_location
+            for cell_x in range(int(location.x // CANVAS_INDEX_CELL_SIZE),
+                int((location.x + sizes['component_x']) // CANVAS_INDEX_CELL_SIZE) + 1):
+                for cell_y in range(int(location.y // CANVAS_INDEX_CELL_SIZE),
+                    int((location.y + sizes['component_y']) // CANVAS_INDEX_CELL_SIZE) + 1):
+                    index.setdefault((cell_x, cell_y), []).append((position, component, geometry))
+        self.canvas_index = index
+
+    def build_hit_index(self):
+        '''
+        Sorts the on-screen bounds of every component and conveyance into a grid of square cells, so
+        that finding what lies under a point only means checking the ones in that point's cell. Each
+        cell lists them in the same order as the geometry mapping. Components which haven't been
+        drawn yet, and conveyances whose paths haven't been laid out, have no bounds to hit and are
+        left out.
+        '''
+
+        index = {}
+        for id, geometry in self.geometry.items():
+            if isinstance(geometry, ComponentGeometry):
+                if geometry.label is None:
+                    continue
+                bounds = geometry.bounds
+            else:
+                bounds = getattr(geometry, 'bounds', None)
+                if bounds is None:
+                    continue
+            for cell_x in range(int(bounds.left // HIT_INDEX_CELL_SIZE),
+                int(bounds.right // HIT_INDEX_CELL_SIZE) + 1):
+                for cell_y in range(int(bounds.top // HIT_INDEX_CELL_SIZE),
+                    int(bounds.bottom // HIT_INDEX_CELL_SIZE) + 1):
+                    index.setdefault((cell_x, cell_y), []).append((id, bounds))
+        self.hit_index = index
+
     def get_components_under_coordinate(self,
         coordinate: Coordinate2D
     ) -> list[Component]:
@@ -743,11 +961,12 @@ class Blueprint(object):
         Returns a list of Components whose geometry contains the given coordinate.
         '''
 
-        components = []
-        for id, geometry in self.geometry.items():
-            if geometry.bounds.contains(coordinate):
-                components.append(self.factory.get_component_by_id(id))
-        return components
+        if self.hit_index is None:
+            self.build_hit_index()
+        cell = (int(coordinate.x // HIT_INDEX_CELL_SIZE), int(coordinate.y // HIT_INDEX_CELL_SIZE))
+        return [ self.factory.get_component_by_id(id)
+            for id, bounds in self.hit_index.get(cell, ())
+            if bounds.contains(coordinate) ]
 
 
 class PangoTextLabel(object):
@@ -755,6 +974,8 @@ class PangoTextLabel(object):
     Represents a textual label drawn with Pango. Used to render text and get its geometry.
     '''
 
+    __slots__ = ('text', 'font', 'pango_ctx', 'layout')
+
     def __init__(self,
         text: str,
         font_family: str,
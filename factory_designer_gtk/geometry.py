@@ -63,6 +63,17 @@ class Coordinate2D(object):
     def __repr__(self):
         return f'<Coordinate2D ({self.x}, {self.y})>'
 
+    def set(self,
+        x: int,
+        y: int
+    ):
+        '''
+        Moves this coordinate in place, for hot paths where creating a new one each time is wasteful.
+        '''
+
+        self.x = x
+        self.y = y
+
 
 class Size2D(object):
     '''
@@ -230,21 +241,25 @@ class ComponentGeometry(object):
         total_width = round(sizes['badges_x'] * len(self.badges) * scale)
         total_width += round(paddings['badges_x'] * (len(self.badges) - 1) * scale)
 
+        # Everything but the horizontal offset from other badges is the same for every badge
+        row_left = round(self.canvas_location.x * scale)     # Start at the left edge
+        row_left += round(sizes['component_x'] * scale / 2)  # Move right to the centerpoint
+        row_left -= round(total_width / 2)  # Go back left by half the width of the whole row
+        translate_x = round(translate.x * scale)
+
+        top = round(self.canvas_location.y * scale) # Start at the top edge of the component
+        top += round(offsets['badges_y'] * scale) # Move down by a hardcoded vertical offset
+        top -= round(translate.y * scale) # Translate
+
+        width = round(sizes['badges_x'] * scale)
+        height = round(sizes['badges_y'] * scale)
+
         # Calculate each badge's geometry
         i = 0
-        for badge in self.badges.keys():
-            left = round(self.canvas_location.x * scale)     # Start at the left edge
-            left += round(sizes['component_x'] * scale / 2)  # Move right to the centerpoint
-            left -= round(total_width / 2)  # Go back left by half the width of the whole row
+        for badge in self.badges:
+            left = row_left
             left += round(i * (sizes['badges_x'] + paddings['badges_x']) * scale ) # Offset from other badges
-            left -= round(translate.x * scale)  # Translate
-
-            top = round(self.canvas_location.y * scale) # Start at the top edge of the component
-            top += round(offsets['badges_y'] * scale) # Move down by a hardcoded vertical offset
-            top -= round(translate.y * scale) # Translate
-
-            width = round(sizes['badges_x'] * scale)
-            height = round(sizes['badges_y'] * scale)
+            left -= translate_x  # Translate
 
             self.badges[badge] = Region2D(Coordinate2D(left, top), Size2D(width, height))
             i += 1
@@ -290,15 +305,19 @@ class ComponentGeometry(object):
         width = round(sizes['input_x'] * scale)
         height = round(sizes['input_y'] * scale)
 
+        # Everything but the vertical offset from other inputs is the same for every input
+        bar_top = round(self.canvas_location.y * scale)
+        bar_top += round(offsets['icon_y'] * scale)  # Start at the top of the icon
+        bar_top += round(sizes['icon_y'] * scale / 2)  # Move down by half the height of the icon
+        bar_top -= round(total_height * scale / 2)  # Move back up by half the height of the full input bar
+        translate_y = round(translate.y * scale)
+
         self.inputs = []
         i = 0
         for input in self.component.inputs:
-            top = round(self.canvas_location.y * scale)
-            top += round(offsets['icon_y'] * scale)  # Start at the top of the icon
-            top += round(sizes['icon_y'] * scale / 2)  # Move down by half the height of the icon
-            top -= round(total_height * scale / 2)  # Move back up by half the height of the full input bar
+            top = bar_top
             top += round(i * (sizes['input_y'] + paddings['inputs_y']) * scale)  # Offset down
-            top -= round(translate.y * scale)
+            top -= translate_y
 
             self.inputs.append(Region2D(Coordinate2D(left, top), Size2D(width, height)))
             i += 1
@@ -352,18 +371,22 @@ class ComponentGeometry(object):
         left += round(offsets['output_x'] * scale)
         left -= round(translate.x * scale)
 
+        width = round(sizes['output_x'] * scale)
+        height = round(sizes['output_y'] * scale)
+
+        # Everything but the vertical offset from other outputs is the same for every output
+        bar_top = round(self.canvas_location.y * scale)
+        bar_top += round(offsets['icon_y'] * scale)  # Start at the top of the icon
+        bar_top += round(sizes['icon_y'] * scale / 2)  # Move down by half the height of the icon
+        bar_top -= round(total_height * scale / 2)  # Move back up by half the height of the full output bar
+        translate_y = round(translate.y * scale)
+
         self.outputs = []
         i = 0
         for output in self.component.outputs:
-            top = round(self.canvas_location.y * scale)
-            top += round(offsets['icon_y'] * scale)  # Start at the top of the icon
-            top += round(sizes['icon_y'] * scale / 2)  # Move down by half the height of the icon
-            top -= round(total_height * scale / 2)  # Move back up by half the height of the full output bar
+            top = bar_top
             top += round(i * (sizes['output_y'] + paddings['outputs_y']) * scale)  # Offset down
-            top -= round(translate.y * scale)
-
-            width = round(sizes['output_x'] * scale)
-            height = round(sizes['output_y'] * scale)
+            top -= translate_y
 
             self.outputs.append(Region2D(Coordinate2D(left, top), Size2D(width, height)))
             i += 1
@@ -421,12 +444,37 @@ class ComponentGeometry(object):
             Size2D(width, height)
         )
 
+    def shift(self,
+        x: int,
+        y: int
+    ):
+        '''
+        Moves all of the calculated geometry by a whole number of pixels without recalculating it.
+        Every piece is offset from the viewport by the same rounded amount, so when only the
+        viewport's location changes, this gives the same result as calculating everything again.
+        Each region is moved in place, since this runs for every component whenever the viewport is
+        dragged.
+        '''
+
+        for region in (self.background, self.icon, self.label):
+            region.location.set(region.left + x, region.top + y)
+        for region in self.badges.values():
+            region.location.set(region.left + x, region.top + y)
+        for region in self.inputs:
+            region.location.set(region.left + x, region.top + y)
+        for region in self.outputs:
+            region.location.set(region.left + x, region.top + y)
+
 
 class ConveyanceGeometry(object):
     '''
     Calculates the pathing used to draw conveyances on the screen.
     '''
 
+    # The inputs the geometry was last calculated from, so that calculating it again from the same
+    # inputs can be skipped. Geometry saved before this existed falls back to this default.
+    calculated_for = None
+
     def __init__(self,
         conveyance: Conveyance = None,
         source_comp: Component = None,  # The component connected to the conveyance's input
@@ -546,8 +594,9 @@ class ConveyanceGeometry(object):
             # Draw a line to the target point
             self.path_str += f'L {self.target_pt.x} {self.target_pt.y}'   # Line to the target point
 
-            # Try to parse the path string
+            # Try to parse the path string. Keep the parsed path so drawing doesn't parse it again.
             path = Gsk.Path.parse(self.path_str)
+            self.path = path
             success, path_bounds = path.get_bounds()
             if success:
                 # Determine the rectangle representing the outer boundary of this path when drawn
@@ -574,13 +623,35 @@ class ConveyanceGeometry(object):
             self.target_cp = None
             self.midpoint = None
 
+    def __getstate__(self) -> dict:
+        # A parsed Gsk.Path can't be pickled, but it can always be parsed again from the path string
+        state = self.__dict__.copy()
+        state['path'] = None
+        return state
+
     def calculate(self,
         label_width: int = None,
         label_height: int = None,
         scale: float = 1.0
     ):
+        # Nothing about the path or label changes unless the scale, the label's size, or the points
+        # the conveyance runs between do. If none of those have changed, the geometry is current.
+        calculated_for = None
+        if self.source_comp and self.target_comp:
+            source_pt = self.source_geo.outputs[self.source_output].middle
+            target_pt = self.target_geo.inputs[self.target_input].middle
+            calculated_for = (
+                scale,
+                source_pt.x, source_pt.y,
+                target_pt.x, target_pt.y,
+                label_width or self.label.width,
+                label_height or self.label.height)
+            if self.geometry is not None and calculated_for == self.calculated_for:
+                return
+
         self.__calculate_turns(scale)
         self.__calculate_label(label_width, label_height)
+        self.calculated_for = calculated_for
 
     @property
     def runs_down(self) -> bool:
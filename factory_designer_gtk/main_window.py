@@ -4,14 +4,18 @@ logging.basicConfig(level=logging.DEBUG)
 import gi
 gi.require_version('Gtk', '4.0')
 
-from gi.repository import Gtk, Gio, GObject
-from gi.repository.GdkPixbuf import Pixbuf
+import os
+import pickle
+from contextlib import contextmanager
+from gi.repository import Gtk, Gio, GLib
 from pathlib import Path
 from satisfactory.base import (
     Availability,
     Building,
     BuildingCategory,
     BuildingType,
+    Component,
+    Connection,
     Conveyance,
     InfiniteSupplyNode,
     Purity,
@@ -28,30 +32,68 @@ from satisfactory.conveyances import get_all as get_all_conveyances
 from satisfactory.factories import Factory
 from satisfactory.items import (
     get_all as get_all_items,
+    get_by_name as get_item_by_name,
     IronOre,
 )
-from satisfactory.recipes import get_all as get_all_recipes
+from satisfactory.recipes import (
+    get_all as get_all_recipes,
+    get_by_name as get_recipe_by_name,
+)
 from satisfactory.storages import get_all as get_all_storages
+from threading import Thread
+from typing import Callable
 from factory_designer_gtk.dialogs import (
     ConfirmOrCancelWindow,
     ConnectionManagementWindow,
     ConnectionManagementWindowResponse,
 )
-from factory_designer_gtk.drawing import Blueprint
+from factory_designer_gtk.drawing import (
+    BASE_IMAGE_FILE_PATH,
+    Blueprint,
+)
 from factory_designer_gtk.geometry import Coordinate2D
 from factory_designer_gtk.widgets import (
+    BuildingListItem,
     FactoryDesignerWidget,
+    fill_combo_box,
+    get_texture_from_file,
+    IngredientListItem,
     InteractionMode,
-    TaggableButton,
+    pack_box,
+    PortListItem,
     TaggableEntryBuffer,
     TagBox,
 )
 
 
 ALL_BUILDINGS = None
+CONVEYABLE_ITEMS = None
+RECIPES_BY_BUILDING_TYPE = None
+# Items which can be produced by miner recipes; these are what a resource node can be set to provide
+NODE_ITEMS = sorted({ ingredient.item.programmatic_name()
+    for _, recipe in get_all_recipes() if recipe.building_type == BuildingType.MINER
+    for ingredient in recipe.produces })
+NODE_ITEM_INDICES = { item: i for i, item in enumerate(NODE_ITEMS) }
+# These never change, so their drop down models are built once and shared by every window
+PURITIES = list(Purity)
+PURITY_INDICES = { purity: i for i, purity in enumerate(PURITIES) }
+PURITY_MODEL = Gtk.StringList.new([ purity.name.title() for purity in PURITIES ])
+TIER_MODEL = Gtk.StringList.new(Availability.get_tier_strings())
 MAIN_WINDOW_DEFAULT_WIDTH = 1920
 MAIN_WINDOW_DEFAULT_HEIGHT = 1080
 MAIN_WINDOW_TITLE_BASE = 'Satisfactory Designer'
+MAIN_WINDOW_UI_FILE = str(Path(__file__).with_name('main_window.ui'))
+COMPONENT_IMAGE_FILE_PATH = f'{BASE_IMAGE_FILE_PATH}/components'
+SIDE_PANEL_MIN_CONTENT_WIDTH = 250  # Keep in sync with min-content-width in main_window.ui
+# Ranges for the spin buttons' adjustments. Each spin button still gets its own Gtk.Adjustment,
+# since that's where the spin button's value lives.
+CLOCK_RATE_RANGE = { 'lower': 0.0, 'upper': 2.5, 'step_increment': 0.1, 'page_increment': 1.0 }
+ISN_RATE_RANGE = { 'lower': 0, 'upper': 1000, 'step_increment': 1, 'page_increment': 10,
+    'page_size': 10 }
+# How long to wait for typing or spinning to stop before updating the window to match
+ENTRY_UPDATE_DELAY_MS = 150
+NAME_FILTER_DELAY_MS = 100
+SPIN_UPDATE_DELAY_MS = 100
 
 
 class MainWindow(Gtk.ApplicationWindow):
@@ -71,9 +113,17 @@ class MainWindow(Gtk.ApplicationWindow):
     ):
         super().__init__(*args, **kwargs)
 
+        self.batch_depth = 0  # How many batch_updates() blocks we're currently inside of
+        self.batch_skip = None  # Widgets to skip in the update deferred by batch_updates()
         self.blueprint = None
         self.blueprintFile = filename
-        self.buildings = []
+        self.change_count = 0  # How many times the blueprint has been changed since the app started
+        self.buildings_filter_state = None  # Filter state the buildings list was last built from
+        self.component_panel_built = False  # The component details panel is built on demand
+        self.dirty_geometry = set()  # IDs of components whose geometry needs recalculating
+        self.pending_build_class = None  # Kind of component to build where the user clicks next
+        self.pending_updates = {}  # GLib source IDs of deferred updates, keyed by what they're for
+        self.saving = False  # True while a blueprint is being written out on a worker thread
         self.unsaved_changes = False
 
         self.filters = {
@@ -91,6 +141,18 @@ class MainWindow(Gtk.ApplicationWindow):
 
         self.update_window()
 
+    @property
+    def unsaved_changes(self) -> bool:
+        return self.__unsaved_changes
+
+    @unsaved_changes.setter
+    def unsaved_changes(self, unsaved_changes: bool):
+        # Count each change, so work running in the background can tell whether any were made while
+        # it ran
+        if unsaved_changes:
+            self.change_count += 1
+        self.__unsaved_changes = unsaved_changes
+
 
     # Common Functions
 
@@ -101,8 +163,8 @@ class MainWindow(Gtk.ApplicationWindow):
         to `self.windowSignals`.
         '''
 
-        for handler in self.windowSignals:
-            GObject.signal_handler_block(handler[0], handler[1])
+        for obj, handler_id in self.windowSignals:
+            obj.handler_block(handler_id)
 
     def confirm_discard(self, callback):
         '''
@@ -118,7 +180,8 @@ class MainWindow(Gtk.ApplicationWindow):
     @staticmethod
     def get_building_options():
         '''
-        Returns a list of all buildings the library is aware of; caches the result for quick access.
+        Returns a list of all buildings the library is aware of, sorted by name; caches the result for
+        quick access.
         '''
 
         global ALL_BUILDINGS
@@ -128,31 +191,271 @@ class MainWindow(Gtk.ApplicationWindow):
                 ALL_BUILDINGS.append(bldg())
             #ALL_BUILDINGS.extend([ bldg() for bldg in get_all_buildings()])
             ALL_BUILDINGS.extend([ bldg() for bldg in get_all_storages()])
+            ALL_BUILDINGS.sort(key=lambda x: x.name)
         return ALL_BUILDINGS
 
+    @staticmethod
+    def get_compatible_recipes(
+        building_type: BuildingType
+    ) -> list[tuple]:
+        '''
+        Returns a list of (recipe_name, recipe) tuples, sorted by name, for all recipes which can be
+        processed by the given type of building. The recipes are grouped by building type once and
+        cached for quick access.
+        '''
+
+        global RECIPES_BY_BUILDING_TYPE
+        if RECIPES_BY_BUILDING_TYPE is None:
+            RECIPES_BY_BUILDING_TYPE = {}
+            for recipe_name, recipe in sorted(get_all_recipes(), key=lambda x: x[0]):
+                RECIPES_BY_BUILDING_TYPE.setdefault(recipe.building_type, []).append(
+                    (recipe_name, recipe))
+        return RECIPES_BY_BUILDING_TYPE.get(building_type, [])
+
+    @staticmethod
+    def get_conveyable_items() -> list[tuple]:
+        '''
+        Returns a list of (item_name, item) tuples for all items which can be conveyed; caches the
+        result for quick access.
+        '''
+
+        global CONVEYABLE_ITEMS
+        if CONVEYABLE_ITEMS is None:
+            CONVEYABLE_ITEMS = [ (item_name, item) for item_name, item in get_all_items()
+                if item.conveyance_type is not None ]
+        return CONVEYABLE_ITEMS
+
+    def get_component_image_file(self,
+        name: str
+    ) -> str:
+        '''
+        Returns the path to the image for the building or item with the given programmatic name, or
+        None if there is no such image.
+        '''
+
+        filename = f'{name}.png'
+        if filename in self.component_images:
+            return f'{COMPONENT_IMAGE_FILE_PATH}/{filename}'
+        return None
+
     def load_blueprint(self,
         filename: str
     ):
         '''
-        Opens a factory blueprint file for use with the application and triggers a UI update.
+        Opens a factory blueprint file for use with the application and triggers a UI update. The
+        file is read on a worker thread so the UI stays responsive; the window is updated from the
+        main loop once loading has finished.
+        '''
+
+        Thread(target=self.__load_blueprint_worker, args=[filename, self.change_count],
+            daemon=True).start()
+
+    def __load_blueprint_worker(self,
+        filename: str,
+        change_count: int
+    ):
+        '''
+        Loads a blueprint off of the UI thread, then hands the result back to the main loop. GTK
+        widgets must not be touched here.
         '''
 
+        # Anything that stops the load before it finishes counts as a failed load, even errors
+        # which aren't caught here and propagate out of the thread
+        error = RuntimeError('The blueprint load did not complete')
+        loadedBlueprint = None
         try:
-            # Load the blueprint and store it in the class as separate actions,
-            # resulting in no change if an exception is thrown at load time.
             loadedBlueprint = Blueprint.load(filename)
+            if isinstance(loadedBlueprint, Blueprint):
+                error = None
+            else:
+                error = TypeError(f'{filename} does not contain a blueprint')
+        except (OSError, AttributeError, EOFError, ImportError, IndexError, ValueError,
+            pickle.UnpicklingError) as ex:
+            # A corrupt or truncated file, or one saved by an incompatible version, fails to
+            # unpickle with one of these
+            logging.exception(f'Error loading blueprint from file {filename}')
+            error = ex
+        finally:
+            # Always hand back to the main loop, so the user hears about a failed load
+            if error is None:
+                GLib.idle_add(self.__blueprint_loaded, filename, loadedBlueprint, change_count)
+            else:
+                GLib.idle_add(self.__blueprint_load_failed, filename, error)
+
+    def __blueprint_loaded(self,
+        filename: str,
+        loadedBlueprint: Blueprint,
+        change_count: int
+    ) -> bool:
+        '''
+        Runs on the main loop after a blueprint has been loaded. The blueprint is only stored in the
+        window here, resulting in no change if an exception was thrown at load time. If the user
+        changed the current blueprint while the file was loading, they're asked before those
+        changes get replaced.
+        '''
+
+        if self.change_count != change_count:
+            self.confirm_discard(lambda response: response
+                and self.__use_loaded_blueprint(filename, loadedBlueprint))
+        else:
+            self.__use_loaded_blueprint(filename, loadedBlueprint)
+        return GLib.SOURCE_REMOVE
+
+    def __use_loaded_blueprint(self,
+        filename: str,
+        loadedBlueprint: Blueprint
+    ):
+        '''
+        Replaces the current blueprint with one which has just been loaded from the given file.
+        '''
+
+        self.blueprintFile = filename
+        self.blueprint = loadedBlueprint
+        self.blueprint.selected = None
+        self.factoryDesigner.blueprint = self.blueprint
+        self.unsaved_changes = False
+        self.update_window()
+
+    def save_blueprint(self,
+        filename: str
+    ):
+        '''
+        Saves the current blueprint to a file. The blueprint is pickled here on the main loop, where
+        nothing can change it partway through. Like loading, the file is then written on a worker
+        thread so the UI stays responsive; the save buttons are disabled until the write has
+        finished.
+        '''
+
+        try:
+            data = pickle.dumps(self.blueprint, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError) as ex:
+            # Pickle raises TypeError for objects it doesn't know how to serialize
+            logging.exception(f'Error saving blueprint at file {filename}')
+            self.__blueprint_saved(filename, ex, self.change_count)
+            return
+
+        self.saving = True
+        self.btnSaveFactory.set_sensitive(False)
+        self.btnSaveFactoryAs.set_sensitive(False)
+        Thread(target=self.__save_blueprint_worker, args=[filename, data, self.change_count],
+            daemon=True).start()
+
+    def place_pending_build(self,
+        canvas_location: Coordinate2D
+    ):
+        '''
+        Creates a default instance of the kind of component chosen with the "Build" button, adds it
+        to the blueprint at the given canvas location, and selects it.
+        '''
+
+        building_class = self.pending_build_class
+        self.pending_build_class = None
+        self.factoryDesigner.set_cursor_from_name(None)
+        if building_class is None:
+            return
+
+        if building_class is ResourceNode:
+            new_component = building_class(item=IronOre)
+        else:
+            new_component = building_class()
+        self.blueprint.add_component(new_component, canvas_location)
+        self.blueprint.selected = new_component
+        self.unsaved_changes = True
+        self.update_window()
+
+    def __save_blueprint_worker(self,
+        filename: str,
+        data: bytes,
+        change_count: int
+    ):
+        '''
+        Writes a pickled blueprint off of the UI thread, then hands the result back to the main
+        loop. GTK widgets must not be touched here.
+        '''
+
+        # Anything that stops the write before it finishes counts as a failed save, even errors
+        # which aren't caught here and propagate out of the thread
+        error = RuntimeError('The blueprint write did not complete')
+        try:
+            with open(filename, 'wb') as fh:
+                fh.write(data)
+            error = None
+        except OSError as ex:
+            logging.exception(f'Error saving blueprint at file {filename}')
+            error = ex
+        finally:
+            # Always hand back to the main loop, or saving would never be allowed again
+            GLib.idle_add(self.__blueprint_saved, filename, error, change_count)
+
+    def __blueprint_saved(self,
+        filename: str,
+        ex: Exception | None,
+        change_count: int
+    ) -> bool:
+        '''
+        Runs on the main loop after a blueprint save has finished. The window only adopts the new
+        file name if the save succeeded, so a failed save doesn't change the app context. Changes
+        made while the file was being written aren't in it, so they still count as unsaved.
+        '''
+
+        self.saving = False
+        self.btnSaveFactoryAs.set_sensitive(True)
+        if ex is None:
             self.blueprintFile = filename
-            self.blueprint = loadedBlueprint
-            self.blueprint.selected = None
-            self.factoryDesigner.blueprint = self.blueprint
-            self.unsaved_changes = False
-            self.update_window()
-        except IOError as ex:
+            if self.change_count == change_count:
+                self.unsaved_changes = False
+        else:
             dlgError = Gtk.AlertDialog()
             dlgError.set_modal(True)
             dlgError.set_message(
-                f'An error occurred when loading a blueprint from file {filename}\n  {ex}')
+                f'An error occurred when saving a blueprint to file {filename}\n  {ex}')
             dlgError.show(self)
+        self.update_window()
+        return GLib.SOURCE_REMOVE
+
+    def __blueprint_load_failed(self,
+        filename: str,
+        ex: Exception
+    ) -> bool:
+        '''
+        Runs on the main loop after a blueprint has failed to load, showing the user the error.
+        '''
+
+        dlgError = Gtk.AlertDialog()
+        dlgError.set_modal(True)
+        dlgError.set_message(
+            f'An error occurred when loading a blueprint from file {filename}\n  {ex}')
+        dlgError.show(self)
+        return GLib.SOURCE_REMOVE
+
+    def schedule_update(self,
+        key: str,
+        func: Callable,
+        delay_ms: int
+    ):
+        '''
+        Runs `func` once `delay_ms` milliseconds have passed without this being called again with the
+        same key. Signals like text insertion fire once per keystroke; this lets their handlers
+        restart a short timer each time and do the expensive work only once the burst is over.
+
+            - key: Identifies what the update is for; scheduling it again replaces the pending one
+            - func: What to run once things settle down
+            - delay_ms: How long to wait, in milliseconds
+        '''
+
+        source_id = self.pending_updates.pop(key, None)
+        if source_id:
+            GLib.source_remove(source_id)
+        self.pending_updates[key] = GLib.timeout_add(delay_ms,
+            self.__run_scheduled_update, key, func)
+
+    def __run_scheduled_update(self,
+        key: str,
+        func: Callable
+    ):
+        del self.pending_updates[key]
+        func()
+        return GLib.SOURCE_REMOVE
 
     def set_tier_and_upgrade(self,
         tier: int = None,
@@ -166,22 +469,20 @@ class MainWindow(Gtk.ApplicationWindow):
         '''
 
         if self.blueprint:
-            self.block_all_signals()
-            # Update the factory model first
-            if tier is not None:
-                self.blueprint.factory.availability.tier = tier
-            if upgrade is not None:
-                self.blueprint.factory.availability.upgrade = upgrade
-
-            # Set the tier value in the combo box
-            self.cboTier.set_active(self.blueprint.factory.availability.tier)
-
-            # Populate the appropriate upgrade values
-            self.cboUpgrade.remove_all()
-            for upgrade in Availability.get_upgrade_strings(self.blueprint.factory.availability.tier):
-                self.cboUpgrade.append(upgrade, upgrade)
-            self.cboUpgrade.set_active(self.blueprint.factory.availability.upgrade - 1)
-            self.unblock_all_signals()
+            with self.signals_blocked():
+                # Update the factory model first
+                if tier is not None:
+                    self.blueprint.factory.availability.tier = tier
+                if upgrade is not None:
+                    self.blueprint.factory.availability.upgrade = upgrade
+
+                # Set the tier value in the combo box
+                self.drpTier.set_selected(self.blueprint.factory.availability.tier)
+
+                # Populate the appropriate upgrade values
+                fill_combo_box(self.cboUpgrade, [ (upgrade, upgrade) for upgrade
+                    in Availability.get_upgrade_strings(self.blueprint.factory.availability.tier) ])
+                self.cboUpgrade.set_active(self.blueprint.factory.availability.upgrade - 1)
 
     def set_window_title(self):
         '''
@@ -192,6 +493,55 @@ class MainWindow(Gtk.ApplicationWindow):
         title_suffix = f' ({self.blueprintFile.split('/')[-1]})' if self.blueprintFile else ''
         self.set_title(f'{title_prefix}{MAIN_WINDOW_TITLE_BASE}{title_suffix}')
 
+    @contextmanager
+    def signals_blocked(self):
+        '''
+        Context manager which blocks all signal handlers registered to `self.windowSignals` for the
+        duration of a `with` block, unblocking them again even if the block raises. Blocks nest, so
+        it's safe to use this inside another `with self.signals_blocked():`.
+        '''
+
+        self.block_all_signals()
+        try:
+            yield
+        finally:
+            self.unblock_all_signals()
+
+    def recalculate_dirty_geometry(self):
+        '''
+        Recalculates the geometry of every component which has been marked as needing it since the
+        last time this ran. Each component is only recalculated once, however many of its
+        properties changed in the meantime.
+        '''
+
+        if self.blueprint and self.dirty_geometry:
+            scale = self.blueprint.viewport.scale
+            translate = self.blueprint.viewport.region.location
+            for component_id in self.dirty_geometry:
+                geo = self.blueprint.geometry.get(component_id)
+                if geo is not None:
+                    geo.calculate(scale=scale, translate=translate)
+            self.blueprint.hit_index = None
+        self.dirty_geometry.clear()
+
+    @contextmanager
+    def batch_updates(self):
+        '''
+        Context manager which defers calls to `update_window` made inside of a `with` block, running
+        a single update when the outermost block exits instead of one for each change. Blocks nest,
+        and only widgets which every deferred call asked to skip are skipped in the final update.
+        '''
+
+        self.batch_depth += 1
+        try:
+            yield
+        finally:
+            self.batch_depth -= 1
+            if self.batch_depth == 0 and self.batch_skip is not None:
+                skip = self.batch_skip
+                self.batch_skip = None
+                self.update_window(skip=skip)
+
     def unblock_all_signals(self):
         '''
         Removes a block from all signal handlers, restoring their ability to emit signals. These
@@ -199,8 +549,8 @@ class MainWindow(Gtk.ApplicationWindow):
         unblock must be registered with `self.windowSignals`.
         '''
 
-        for handler in self.windowSignals:
-            GObject.signal_handler_unblock(handler[0], handler[1])
+        for obj, handler_id in self.windowSignals:
+            obj.handler_unblock(handler_id)
 
     def update_buildings_list(self):
         '''
@@ -208,45 +558,23 @@ class MainWindow(Gtk.ApplicationWindow):
         '''
 
         if self.blueprint:
-            # Determine the available buildings
-            all_buildings = MainWindow.get_building_options()
-            if self.filters['availability']:
-                avail_buildings = []
-                for building in all_buildings:
-                    if self.blueprint.factory.availability.tier > building.availability.tier:
-                        avail_buildings.append(building)
-                    elif self.blueprint.factory.availability.tier == building.availability.tier:
-                        if self.blueprint.factory.availability.upgrade >= building.availability.upgrade:
-                            avail_buildings.append(building)
-            else:
-                avail_buildings = all_buildings
-
-            # Filter out anything that doesn't match the building category
-            if self.filters['building_category'] and self.cboBuildingCategory.get_active() != -1:
-                avail_buildings = [ building for building in avail_buildings
-                    if building.building_category.name == self.cboBuildingCategory.get_active_text().upper() ]
-
-            # Filter out anything that doesn't match the name
-            if self.filters['name'] and self.entryNameFilter.get_buffer().get_text() != '':
-                avail_buildings = [ building for building in avail_buildings
-                    if self.entryNameFilter.get_buffer().get_text().lower() in building.name.lower() ]
-
-            # Sort the list alphabetically
-            avail_buildings = sorted(avail_buildings, key=lambda x: x.name)
-
-            # Convert the list to a ListStore, pulling in images where possible. At the same time,
-            # update the window's list of buildings to make this data accessible later.
-            self.buildings = []
-            listStore = Gtk.ListStore(Pixbuf, str)
-            for building in avail_buildings:
-                listStore.append((
-                    self.pixelBuffers['building_options'][building.__class__.__name__],
-                    building.name))
-                self.buildings.append(building.__class__)
-            self.lstBuildings = listStore
-            self.icovwBuildings.set_model(self.lstBuildings)
-            self.icovwBuildings.set_pixbuf_column(0)
-            self.icovwBuildings.set_text_column(1)
+            # The list only changes when the filters or the factory's availability do. If none of
+            # those have changed since the list was last built, there's nothing to do. The values
+            # are normalized here so they compare directly against each BuildingListItem.
+            category = self.cboBuildingCategory.get_active_id()
+            name = self.entryNameFilter.get_buffer().get_text().lower()
+            filter_state = (
+                (self.blueprint.factory.availability.tier,
+                    self.blueprint.factory.availability.upgrade)
+                    if self.filters['availability'] else None,
+                category if self.filters['building_category'] and category else None,
+                name if self.filters['name'] and name else None)
+            if filter_state == self.buildings_filter_state:
+                return
+            self.buildings_filter_state = filter_state
+
+            # The grid view's model is built once; all we have to do is have it re-run the filter
+            self.filterBuildings.changed(Gtk.FilterChange.DIFFERENT)
 
     def update_component_context(self,
         skip: list = []
@@ -320,8 +648,7 @@ class MainWindow(Gtk.ApplicationWindow):
                 and not isinstance(c, Conveyance) \
                 and not isinstance(c, Storage):
                     # Always filter compatible recipes by building type
-                    compatible_recipes = [ (recipe_name, recipe) for recipe_name, recipe in get_all_recipes()
-                        if recipe.building_type == c.building_type]
+                    compatible_recipes = MainWindow.get_compatible_recipes(c.building_type)
                     # If the user has availability filtering enabled, filter by that as well
                     available_recipes = []
                     if self.chkAvailability.get_active():
@@ -336,33 +663,30 @@ class MainWindow(Gtk.ApplicationWindow):
                     else:
                         available_recipes = compatible_recipes
 
-                    compatible_recipes.sort(key=lambda x: x[0])
-
                     # Recreate the contents of the recipe selector
                     if self.cboComponentSelectedRecipe not in skip:
-                        self.cboComponentSelectedRecipe.remove_all()
-                        for recipe_name, recipe in compatible_recipes:
-                            self.cboComponentSelectedRecipe.append(recipe_name, recipe.name)
+                        fill_combo_box(self.cboComponentSelectedRecipe, [
+                            (recipe_name, recipe.name)
+                            for recipe_name, recipe in compatible_recipes ])
                         if c.recipe:
                             current_recipe = c.recipe.programmatic_name()
                             # Determine index of current recipe and set the recipe selector to that
-                            current_recipe_id = None
-                            for i in range(len(compatible_recipes)):
-                                if compatible_recipes[i][0] == current_recipe:
-                                    current_recipe_id = i
-                                    break
-                            if current_recipe is not None:
+                            current_recipe_id = next((i for i, (recipe_name, _)
+                                in enumerate(compatible_recipes)
+                                if recipe_name == current_recipe), None)
+                            if current_recipe_id is not None:
                                 self.cboComponentSelectedRecipe.set_active(current_recipe_id)
 
                     if c.recipe:
-                        consumes_store = Gtk.ListStore(Pixbuf, str)
-                        produces_store = Gtk.ListStore(Pixbuf, str)
+                        consumes = []
+                        produces = []
                         if c.recipe.consumes:
                             for ingredient in c.recipe.consumes:
                                 ing_rate = ingredient.rate * c.clock_rate
-                                consumes_store.append((
-                                    self.pixelBuffers['items'][ingredient.item.programmatic_name()],
-                                    f'{ing_rate}x {ingredient.item.name} /m'))
+                                consumes.append(IngredientListItem(
+                                    f'{ing_rate}x {ingredient.item.name} /m',
+                                    self.get_component_image_file(
+                                        ingredient.item.programmatic_name())))
                         if c.recipe.produces:
                             for ingredient in c.recipe.produces:
                                 if isinstance(c, Miner):
@@ -373,15 +697,13 @@ class MainWindow(Gtk.ApplicationWindow):
                                 else:
                                     ing_rate = ingredient.rate
                                 ing_rate *= c.clock_rate
-                                produces_store.append((
-                                    self.pixelBuffers['items'][ingredient.item.programmatic_name()],
-                                    f'{ing_rate}x {ingredient.item.name} /m'))
-                        self.icovwConsumes.set_model(consumes_store)
-                        self.icovwConsumes.set_pixbuf_column(0)
-                        self.icovwConsumes.set_text_column(1)
-                        self.icovwProduces.set_model(produces_store)
-                        self.icovwProduces.set_pixbuf_column(0)
-                        self.icovwProduces.set_text_column(1)
+                                produces.append(IngredientListItem(
+                                    f'{ing_rate}x {ingredient.item.name} /m',
+                                    self.get_component_image_file(
+                                        ingredient.item.programmatic_name())))
+                        # Swap out the stores' contents in one go so the views only update once
+                        self.lstConsumes.splice(0, self.lstConsumes.get_n_items(), consumes)
+                        self.lstProduces.splice(0, self.lstProduces.get_n_items(), produces)
                         self.boxSelectedRecipe.set_visible(True)
                     else:
                         self.boxSelectedRecipe.set_visible(False)
@@ -396,8 +718,7 @@ class MainWindow(Gtk.ApplicationWindow):
                     self.spinISNRecipeRate.set_value(c.rate or 0.0)
 
                 # Filter out items that can't be conveyed
-                items = [(item_name, item) for item_name, item in get_all_items()
-                    if item.conveyance_type is not None]
+                items = MainWindow.get_conveyable_items()
 
                 # If the availability filter is on, filter those out, too
                 if self.chkAvailability.get_active():
@@ -407,18 +728,14 @@ class MainWindow(Gtk.ApplicationWindow):
 
                 # Populate the combo box
                 if self.cboISNRecipeItem not in skip:
-                    self.cboISNRecipeItem.remove_all()
-                    for item_name, item in items:
-                        self.cboISNRecipeItem.append(item_name, item.name)
+                    fill_combo_box(self.cboISNRecipeItem, [
+                        (item_name, item.name) for item_name, item in items ])
                     current_item = c.item.programmatic_name()
-                    current_item_id = None
 
                     # Set the current item as active
-                    for i in range(len(items)):
-                        if items[i][0] == current_item:
-                            current_item_id = i
-                            break
-                    if current_item is not None:
+                    current_item_id = next((i for i, (item_name, _) in enumerate(items)
+                        if item_name == current_item), None)
+                    if current_item_id is not None:
                         self.cboISNRecipeItem.set_active(current_item_id)
 
                 # Make sure the right widgets are presented
@@ -429,13 +746,13 @@ class MainWindow(Gtk.ApplicationWindow):
             elif isinstance(c, ResourceNode):
                 # Set item dropdown by index
                 if self.cboResourceNodeItem not in skip:
-                    node_item_index = self.node_items.index(c.item.programmatic_name())
+                    node_item_index = NODE_ITEM_INDICES[c.item.programmatic_name()]
                     self.cboResourceNodeItem.set_active(node_item_index)
 
                 # Set purity dropdown by index
-                if self.cboResourceNodePurity not in skip:
-                    purity_index = self.purities.index(c.purity)
-                    self.cboResourceNodePurity.set_active(purity_index)
+                if self.drpResourceNodePurity not in skip:
+                    purity_index = PURITY_INDICES[c.purity]
+                    self.drpResourceNodePurity.set_selected(purity_index)
 
                 # Set what we can see
                 self.boxResourceNodeRecipe.set_visible(True)
@@ -449,103 +766,28 @@ class MainWindow(Gtk.ApplicationWindow):
                 self.boxResourceNodeRecipe.set_visible(False)
                 self.boxSelectedRecipe.set_visible(False)
 
-            # Update the build cost of the component
-            recipe_store = Gtk.ListStore(Pixbuf, str)
-
-            # Prepare to set up current connection data by clearing out the old data
-            for i in range(len(self.icovwInputs)):
-                self.boxComponentInputs.remove(self.icovwInputs[i])
-                self.boxComponentInputs.remove(self.btnConnectInputs[i])
-            for i in range(len(self.icovwOutputs)):
-                self.boxComponentOutputs.remove(self.icovwOutputs[i])
-                self.boxComponentOutputs.remove(self.btnConnectOutputs[i])
-
-            # Update inputs
-            self.boxComponentInputs.remove(self.lblNoInputs)
-            self.icovwInputs = []  # Clear out the list of IconViews showing the inputs
-            self.btnConnectInputs = []
-            for i in range(len(c.inputs)):  # Create one IconView and Button per input
-                icovw = Gtk.IconView()
-                store = Gtk.ListStore(Pixbuf, str)
-                for ingredient in c.inputs[i].ingredients:
-                    store.append((
-                        self.pixelBuffers['items'][ingredient.item.programmatic_name()],
-                        f'{ingredient.rate}x {ingredient.item.name} /m'
-                    ))
-                icovw.set_model(store)
-                icovw.set_pixbuf_column(0)
-                icovw.set_text_column(1)
-                self.icovwInputs.append(icovw)
-
-                button = TaggableButton(tags={
-                    'component': c,
-                    'connection': c.inputs[i],
-                    'connection_index': i})
-                button.set_label('Manage...')
-                button.connect('clicked', self.__btnConnection_clicked)
-                self.btnConnectInputs.append(button)
-
-            # Show either the IconViews or a "None" label
-            if len(self.icovwInputs) == 0:
-                self.boxComponentInputs.append(self.lblNoInputs)
-            for i in range(len(self.icovwInputs)):
-                self.boxComponentInputs.append(self.icovwInputs[i])
-                self.boxComponentInputs.append(self.btnConnectInputs[i])
-
-            # Update the outputs in the same way
-            self.boxComponentOutputs.remove(self.lblOutputs)
-            self.icovwOutputs = []
-            self.btnConnectOutputs = []
-            for i in range(len(c.outputs)):
-                icovw = Gtk.IconView()
-                store = Gtk.ListStore(Pixbuf, str)
-                for ingredient in c.outputs[i].ingredients:
-                    store.append((
-                        self.pixelBuffers['items'][ingredient.item.programmatic_name()],
-                        f'{ingredient.rate}x {ingredient.item.name} /m'
-                    ))
-                icovw.set_model(store)
-                icovw.set_pixbuf_column(0)
-                icovw.set_text_column(1)
-                self.icovwOutputs.append(icovw)
-
-                button = TaggableButton(tags={
-                    'component': c,
-                    'connection': c.outputs[i],
-                    'connection_index': i})
-                button.set_label('Manage...')
-                button.connect('clicked', self.__btnConnection_clicked)
-                self.btnConnectOutputs.append(button)
-
-            # Show either the IconView or a "None" label
-            if len(self.icovwOutputs) > 0:
-                self.boxComponentOutputs.append(self.lblOutputs)
-            for i in range(len(self.icovwOutputs)):
-                self.boxComponentOutputs.append(self.icovwOutputs[i])
-                self.boxComponentOutputs.append(self.btnConnectOutputs[i])
+            # Swap in one row per input and output, or show a "None" label if there aren't any
+            self.lstInputs.splice(0, self.lstInputs.get_n_items(),
+                self.__build_port_list_items(c, c.inputs))
+            self.lblNoInputs.set_visible(len(c.inputs) == 0)
+            self.lstOutputs.splice(0, self.lstOutputs.get_n_items(),
+                self.__build_port_list_items(c, c.outputs))
+            self.lblNoOutputs.set_visible(len(c.outputs) == 0)
 
             # Get the recipe to build the component so we can update the build cost
-            try:
-                comp_recipe_name, comp_recipe = [ (name, recipe) for name, recipe
-                    in get_all_recipes()
-                    if name == c.__class__.__name__ ][0]
-            except IndexError:
-                logging.debug('Failed to get the component recipe')
-                comp_recipe = None
+            comp_recipe = get_recipe_by_name(c.__class__.__name__)
 
             # If there is a recipe, display it
             self.boxComponentRecipe.remove(self.lblComponentRecipe)
-            self.boxComponentRecipe.remove(self.icovwComponentRecipe)
+            self.boxComponentRecipe.remove(self.lstvwComponentRecipe)
             if comp_recipe:
-                for ingredient in comp_recipe.consumes:
-                    recipe_store.append((
-                        self.pixelBuffers['items'][ingredient.item.programmatic_name()],
-                        f'{ingredient.amount}x {ingredient.item.name}'))
-                self.icovwComponentRecipe.set_model(recipe_store)
-                self.icovwComponentRecipe.set_pixbuf_column(0)
-                self.icovwComponentRecipe.set_text_column(1)
+                self.lstComponentRecipe.splice(0, self.lstComponentRecipe.get_n_items(), [
+                    IngredientListItem(
+                        f'{ingredient.amount}x {ingredient.item.name}',
+                        self.get_component_image_file(ingredient.item.programmatic_name()))
+                    for ingredient in comp_recipe.consumes ])
                 self.boxComponentRecipe.append(self.lblComponentRecipe)
-                self.boxComponentRecipe.append(self.icovwComponentRecipe)
+                self.boxComponentRecipe.append(self.lstvwComponentRecipe)
 
             # Update component errors listing
             for lbl in self.lblComponentErrors:
@@ -566,11 +808,10 @@ class MainWindow(Gtk.ApplicationWindow):
             # Update tags listing
             if self.boxComponentTags not in skip:
                 self.boxComponentTags.component = self.blueprint.selected
-                self.boxComponentTags.repopulate()
 
             # Make sure everything is visible
             self.boxComponentDetails.set_visible(True)
-        else:
+        elif self.component_panel_built:
             # If nothing is selected, just hide all these controls
             self.boxComponentDetails.set_visible(False)
 
@@ -579,28 +820,42 @@ class MainWindow(Gtk.ApplicationWindow):
     ):
         '''
         When the factory context of the MainWindow changes, call this function to update all of the
-        UI elements depending on that context.
+        UI elements depending on that context. Inside of a `batch_updates()` block, the update is
+        deferred until the block exits.
         '''
 
-        self.block_all_signals()
-        self.set_window_title()
-        self.update_component_context(skip=skip)
+        if self.batch_depth > 0:
+            if self.batch_skip is None:
+                self.batch_skip = list(skip)
+            else:
+                self.batch_skip = [ widget for widget in self.batch_skip if widget in skip ]
+            return
 
-        # Set availability of various widgets
-        if self.blueprint:
-            self.boxFactoryFunctions.set_sensitive(True)
-            self.btnSaveFactory.set_sensitive(self.unsaved_changes)
-            self.boxFilters.set_sensitive(True)
-            if self.entryFactoryName not in skip:
-                self.entryFactoryName.get_buffer().set_text(self.blueprint.factory.name, -1)
-            self.set_tier_and_upgrade()
-            self.update_buildings_list()
-        else:
-            self.btnSaveFactory.set_sensitive(False)
-            self.boxFactoryFunctions.set_sensitive(False)
-            self.boxFilters.set_sensitive(False)
-        self.factoryDesigner.queue_draw()
-        self.unblock_all_signals()
+        self.recalculate_dirty_geometry()
+
+        # Build the component panel, if this is the first selection, before blocking signals so its
+        # handlers get blocked along with all the others
+        if self.blueprint and self.blueprint.selected:
+            self.__ensure_component_context_panel()
+
+        with self.signals_blocked():
+            self.set_window_title()
+            self.update_component_context(skip=skip)
+
+            # Set availability of various widgets
+            if self.blueprint:
+                self.boxFactoryFunctions.set_sensitive(True)
+                self.btnSaveFactory.set_sensitive(self.unsaved_changes and not self.saving)
+                self.boxFilters.set_sensitive(True)
+                if self.entryFactoryName not in skip:
+                    self.entryFactoryName.get_buffer().set_text(self.blueprint.factory.name, -1)
+                self.set_tier_and_upgrade()
+                self.update_buildings_list()
+            else:
+                self.btnSaveFactory.set_sensitive(False)
+                self.boxFactoryFunctions.set_sensitive(False)
+                self.boxFilters.set_sensitive(False)
+            self.factoryDesigner.queue_draw()
 
 
     # Layout Construction
@@ -616,6 +871,10 @@ class MainWindow(Gtk.ApplicationWindow):
         # Track all signals so we can block/unblock them easily
         self.windowSignals = []
 
+        # The static parts of the window are described in a .ui file, which GtkBuilder constructs in
+        # one pass. The build functions below pick those widgets up and fill in the dynamic parts.
+        self.builder = Gtk.Builder.new_from_file(MAIN_WINDOW_UI_FILE)
+
         # Build a vertical box layout to give us a strip on top for factory tools
         self.boxMain = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
 
@@ -662,59 +921,55 @@ class MainWindow(Gtk.ApplicationWindow):
         self.paneBuildingsOptions = Gtk.Paned(orientation=Gtk.Orientation.VERTICAL)
         self.paneBuildingsOptions.set_position(150)
 
-        # Top pane: filtering options for the bottom pane
-        self.scrollBuildingFilters = Gtk.ScrolledWindow()
-        self.boxFilters = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-        self.boxFilters.set_margin_start(5)
-        self.boxFilters.set_margin_end(5)
-        self.boxFilters.set_margin_bottom(5)
-        self.boxFilters.set_margin_top(5)
-        self.boxFilters.set_spacing(5)
-
-        # Top pane: Factory availability checkbox
-        self.chkAvailability = Gtk.CheckButton(label='Availability')
-        self.chkAvailability.set_active(True)
-        self.boxFilters.append(self.chkAvailability)
-        self.scrollBuildingFilters.set_child(self.boxFilters)
-
-        # Top pane: Building Category selection
-        self.boxBuildingCategory = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-        self.chkBuildingCategory = Gtk.CheckButton(label='Building category: ')
-        self.cboBuildingCategory = Gtk.ComboBoxText()
-        self.cboBuildingCategory.set_hexpand(True)
-        for category in BuildingCategory:
-            self.cboBuildingCategory.append(category.name, category.name.title())
-
-        self.boxBuildingCategory.append(self.chkBuildingCategory)
-        self.boxBuildingCategory.append(self.cboBuildingCategory)
-        self.boxFilters.append(self.boxBuildingCategory)
-
-        # Top pane: Name filter
-        self.boxNameFilter = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-        self.chkNameFilter = Gtk.CheckButton(label='Name: ')
-        self.entryNameFilter = Gtk.Entry()
-        self.entryNameFilter.set_hexpand(True)
-        self.boxNameFilter.append(self.chkNameFilter)
-        self.boxNameFilter.append(self.entryNameFilter)
-        self.boxFilters.append(self.boxNameFilter)
+        # Top pane: filtering options for the bottom pane, built from the .ui file
+        self.scrollBuildingFilters = self.builder.get_object('scrollBuildingFilters')
+        self.boxFilters = self.builder.get_object('boxFilters')
+        self.chkAvailability = self.builder.get_object('chkAvailability')
+        self.boxBuildingCategory = self.builder.get_object('boxBuildingCategory')
+        self.chkBuildingCategory = self.builder.get_object('chkBuildingCategory')
+        self.cboBuildingCategory = self.builder.get_object('cboBuildingCategory')
+        fill_combo_box(self.cboBuildingCategory, [
+            (category.name, category.name.title()) for category in BuildingCategory ])
+        self.boxNameFilter = self.builder.get_object('boxNameFilter')
+        self.chkNameFilter = self.builder.get_object('chkNameFilter')
+        self.entryNameFilter = self.builder.get_object('entryNameFilter')
 
         # Bottom pane: Box to organize things
         self.boxBuildings = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
 
         # Bottom pane: list of buildings
         self.scrollBuildings = Gtk.ScrolledWindow()
-        self.icovwBuildings = Gtk.IconView()
-        self.icovwBuildings.set_spacing(5)
-        self.icovwBuildings.set_vexpand(True)
-        self.scrollBuildings.set_child(self.icovwBuildings)
+        # The full list of buildings, sorted by name, never changes. It gets filtered down to what
+        # the user wants to see, and the grid view only creates widgets for the visible rows.
+        self.lstBuildingOptions = Gio.ListStore.new(BuildingListItem)
+        for building in MainWindow.get_building_options():
+            self.lstBuildingOptions.append(BuildingListItem(
+                building,
+                self.get_component_image_file(building.__class__.__name__)))
+        self.filterBuildings = Gtk.CustomFilter.new(self.__filterBuildings_match)
+        self.lstBuildings = Gtk.FilterListModel.new(self.lstBuildingOptions, self.filterBuildings)
+        self.selBuildings = Gtk.SingleSelection.new(self.lstBuildings)
+        self.selBuildings.set_autoselect(False)
+        self.selBuildings.set_can_unselect(True)
+
+        factoryBuildings = Gtk.SignalListItemFactory()
+        factoryBuildings.connect('setup', self.__factoryBuildings_setup)
+        factoryBuildings.connect('bind', self.__factoryBuildings_bind)
+        factoryBuildings.connect('unbind', self.__factoryBuildings_unbind)
+
+        self.grdvwBuildings = Gtk.GridView.new(self.selBuildings, factoryBuildings)
+        self.grdvwBuildings.set_vexpand(True)
+        self.scrollBuildings.set_child(self.grdvwBuildings)
         self.scrollBuildings.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        self.scrollBuildings.set_propagate_natural_width(False)
+        self.scrollBuildings.set_propagate_natural_height(False)
+        self.scrollBuildings.set_min_content_width(SIDE_PANEL_MIN_CONTENT_WIDTH)
 
         # Bottom pane: Build button
         self.btnBuild = Gtk.Button(label='Build')
 
         # Pack the box
-        self.boxBuildings.append(self.btnBuild)
-        self.boxBuildings.append(self.scrollBuildings)
+        pack_box(self.boxBuildings, self.btnBuild, self.scrollBuildings)
 
         # Compile panel contents
         self.paneBuildingsOptions.set_start_child(self.scrollBuildingFilters)
@@ -728,6 +983,25 @@ class MainWindow(Gtk.ApplicationWindow):
         # Wrap everything in a scrollable view
         self.scrollComponentDetails = Gtk.ScrolledWindow()
 
+        # Give the panel a fixed minimum size and don't let its contents' natural size leak out, so
+        # moving the panes doesn't have to re-measure everything in here
+        self.scrollComponentDetails.set_propagate_natural_width(False)
+        self.scrollComponentDetails.set_propagate_natural_height(False)
+        self.scrollComponentDetails.set_min_content_width(SIDE_PANEL_MIN_CONTENT_WIDTH)
+
+        # All of the lists of ingredients in this panel share one factory for building their rows
+        self.factoryIngredients = Gtk.SignalListItemFactory()
+        self.factoryIngredients.connect('setup', self.__factoryIngredients_setup)
+        self.factoryIngredients.connect('bind', self.__factoryIngredients_bind)
+        self.factoryIngredients.connect('unbind', self.__factoryIngredients_unbind)
+
+        # Inputs and outputs share a factory which builds a row per connection with a button to
+        # manage it
+        self.factoryPorts = Gtk.SignalListItemFactory()
+        self.factoryPorts.connect('setup', self.__factoryPorts_setup)
+        self.factoryPorts.connect('bind', self.__factoryPorts_bind)
+        self.factoryPorts.connect('unbind', self.__factoryPorts_unbind)
+
         # Set up read-only details in a box
         self.boxComponentDetails = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         self.boxComponentDetails.set_margin_start(5)
@@ -752,15 +1026,15 @@ class MainWindow(Gtk.ApplicationWindow):
         self.boxComponentLinks.set_halign(Gtk.Align.CENTER)
         self.linkWiki = Gtk.LinkButton().new_with_label(uri='', label='Wiki')
         self.linkImage = Gtk.LinkButton().new_with_label(uri='', label='Image')
-        self.boxComponentLinks.append(self.linkWiki)
-        self.boxComponentLinks.append(self.linkImage)
+        pack_box(self.boxComponentLinks, self.linkWiki, self.linkImage)
 
         # Pack the outer details box with all of these labels and such
-        self.boxComponentDetails.append(self.lblComponentBuildingType)
-        self.boxComponentDetails.append(self.lblComponentAvailability)
-        self.boxComponentDetails.append(self.lblComponentDimensions)
-        self.boxComponentDetails.append(self.lblComponentBasePowerUsage)
-        self.boxComponentDetails.append(self.boxComponentLinks)
+        pack_box(self.boxComponentDetails,
+            self.lblComponentBuildingType,
+            self.lblComponentAvailability,
+            self.lblComponentDimensions,
+            self.lblComponentBasePowerUsage,
+            self.boxComponentLinks)
 
         # Name controls
         self.boxComponentName = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
@@ -768,8 +1042,7 @@ class MainWindow(Gtk.ApplicationWindow):
         self.lblComponentName = Gtk.Label(label='Name:')
         self.entryComponentName = Gtk.Entry()
         self.entryComponentName.set_hexpand(True)
-        self.boxComponentName.append(self.lblComponentName)
-        self.boxComponentName.append(self.entryComponentName)
+        pack_box(self.boxComponentName, self.lblComponentName, self.entryComponentName)
         self.boxComponentDetails.append(self.boxComponentName)
 
         # Checkboxes for togglables in a box
@@ -777,8 +1050,7 @@ class MainWindow(Gtk.ApplicationWindow):
         self.boxComponentBooleans.set_halign(Gtk.Align.CENTER)
         self.chkComponentConstructed = Gtk.CheckButton(label='Constructed')
         self.chkComponentStandby = Gtk.CheckButton(label='Standby')
-        self.boxComponentBooleans.append(self.chkComponentConstructed)
-        self.boxComponentBooleans.append(self.chkComponentStandby)
+        pack_box(self.boxComponentBooleans, self.chkComponentConstructed, self.chkComponentStandby)
         self.boxComponentDetails.append(self.boxComponentBooleans)
 
         # Processing recipe
@@ -787,24 +1059,21 @@ class MainWindow(Gtk.ApplicationWindow):
         self.boxComponentSelectedRecipe.set_halign(Gtk.Align.CENTER)
         self.lblComponentSelectedRecipe = Gtk.Label(label='Recipe:')
         self.cboComponentSelectedRecipe = Gtk.ComboBoxText()
-        self.boxComponentSelectedRecipe.append(self.lblComponentSelectedRecipe)
-        self.boxComponentSelectedRecipe.append(self.cboComponentSelectedRecipe)
+        pack_box(self.boxComponentSelectedRecipe,
+            self.lblComponentSelectedRecipe,
+            self.cboComponentSelectedRecipe)
         self.boxComponentDetails.append(self.boxComponentSelectedRecipe)
 
         # Clock rate controls
         self.boxComponentClockRate = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
         self.boxComponentClockRate.set_halign(Gtk.Align.CENTER)
         self.lblComponentClockRate = Gtk.Label(label='Clock rate:')
-        self.adjClockSpeed = Gtk.Adjustment(
-            lower=0.0,
-            upper=2.5,
-            step_increment=0.1,
-            page_increment=1.0)
-        self.adjClockSpeed.set_step_increment(0.1)
+        self.adjClockSpeed = Gtk.Adjustment(**CLOCK_RATE_RANGE)
         self.spinComponentClockRate = Gtk.SpinButton(adjustment=self.adjClockSpeed)
         self.spinComponentClockRate.set_digits(2)
-        self.boxComponentClockRate.append(self.lblComponentClockRate)
-        self.boxComponentClockRate.append(self.spinComponentClockRate)
+        pack_box(self.boxComponentClockRate,
+            self.lblComponentClockRate,
+            self.spinComponentClockRate)
         self.boxComponentDetails.append(self.boxComponentClockRate)
 
         # Build a set of controls to display when ResourceNodes are selected
@@ -813,23 +1082,17 @@ class MainWindow(Gtk.ApplicationWindow):
         self.boxResourceNodeRecipe.set_halign(Gtk.Align.CENTER)
         self.lblResourceNodeItem = Gtk.Label(label='Item:')
         self.cboResourceNodeItem = Gtk.ComboBoxText()
-
-        for item in self.node_items:
-            self.cboResourceNodeItem.append(item, item)
+        fill_combo_box(self.cboResourceNodeItem, [ (item, item) for item in NODE_ITEMS ])
 
         # Pack the item widgets
-        self.boxResourceNodeRecipe.append(self.lblResourceNodeItem)
-        self.boxResourceNodeRecipe.append(self.cboResourceNodeItem)
+        pack_box(self.boxResourceNodeRecipe, self.lblResourceNodeItem, self.cboResourceNodeItem)
 
-        # Populate a combo box with node purity levels
+        # A drop down of node purity levels, using the shared model
         self.lblResourceNodePurity = Gtk.Label(label='Purity:')
-        self.cboResourceNodePurity = Gtk.ComboBoxText()
-        for purity in Purity.__members__:
-            self.cboResourceNodePurity.append(purity, purity.title())
+        self.drpResourceNodePurity = Gtk.DropDown.new(PURITY_MODEL, None)
 
         # Pack the resource node widgets
-        self.boxResourceNodeRecipe.append(self.lblResourceNodePurity)
-        self.boxResourceNodeRecipe.append(self.cboResourceNodePurity)
+        pack_box(self.boxResourceNodeRecipe, self.lblResourceNodePurity, self.drpResourceNodePurity)
         self.boxComponentDetails.append(self.boxResourceNodeRecipe)
 
         # Build a set of controls to display when InfiniteSupplyNodes are selected
@@ -837,18 +1100,13 @@ class MainWindow(Gtk.ApplicationWindow):
         self.boxISNRecipe.set_spacing(5)
         self.boxISNRecipe.set_halign(Gtk.Align.CENTER)
         self.lblISNRecipe = Gtk.Label(label='Recipe:')
-        self.spinISNRecipeRate = Gtk.SpinButton()
-        self.adjISNRecipeRate = Gtk.Adjustment(
-            lower=0,
-            upper=1000,
-            step_increment=1,
-            page_increment=10,
-            page_size=10)
-        self.spinISNRecipeRate.set_adjustment(self.adjISNRecipeRate)
+        self.adjISNRecipeRate = Gtk.Adjustment(**ISN_RATE_RANGE)
+        self.spinISNRecipeRate = Gtk.SpinButton(adjustment=self.adjISNRecipeRate)
         self.cboISNRecipeItem = Gtk.ComboBoxText()
-        self.boxISNRecipe.append(self.lblISNRecipe)
-        self.boxISNRecipe.append(self.spinISNRecipeRate)
-        self.boxISNRecipe.append(self.cboISNRecipeItem)
+        pack_box(self.boxISNRecipe,
+            self.lblISNRecipe,
+            self.spinISNRecipeRate,
+            self.cboISNRecipeItem)
         self.boxComponentDetails.append(self.boxISNRecipe)
 
         # Selected recipe consumes/produces details
@@ -862,22 +1120,25 @@ class MainWindow(Gtk.ApplicationWindow):
         self.boxConsumes.set_hexpand(True)
         self.lblConsumes = Gtk.Label()
         self.lblConsumes.set_markup('<b>Consumes</b>')
-        self.icovwConsumes = Gtk.IconView()
-        self.boxConsumes.append(self.lblConsumes)
-        self.boxConsumes.append(self.icovwConsumes)
+        self.lstConsumes = Gio.ListStore.new(IngredientListItem)
+        self.lstvwConsumes = Gtk.ListView.new(
+            Gtk.NoSelection.new(self.lstConsumes),
+            self.factoryIngredients)
+        pack_box(self.boxConsumes, self.lblConsumes, self.lstvwConsumes)
 
         self.boxProduces = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         self.boxProduces.set_halign(Gtk.Align.FILL)
         self.boxProduces.set_hexpand(True)
         self.lblProduces = Gtk.Label()
         self.lblProduces.set_markup('<b>Produces</b>')
-        self.icovwProduces = Gtk.IconView()
-        self.boxProduces.append(self.lblProduces)
-        self.boxProduces.append(self.icovwProduces)
+        self.lstProduces = Gio.ListStore.new(IngredientListItem)
+        self.lstvwProduces = Gtk.ListView.new(
+            Gtk.NoSelection.new(self.lstProduces),
+            self.factoryIngredients)
+        pack_box(self.boxProduces, self.lblProduces, self.lstvwProduces)
 
         # Pack the outer box
-        self.boxSelectedRecipe.append(self.boxConsumes)
-        self.boxSelectedRecipe.append(self.boxProduces)
+        pack_box(self.boxSelectedRecipe, self.boxConsumes, self.boxProduces)
         self.boxComponentDetails.append(self.boxSelectedRecipe)
 
         # Add a visual separator
@@ -895,31 +1156,29 @@ class MainWindow(Gtk.ApplicationWindow):
         self.boxComponentInputs.set_hexpand(True)
         self.lblInputs = Gtk.Label()
         self.lblInputs.set_markup('<b>Inputs</b>')
-        self.icovwInputs = [Gtk.IconView()]
-        self.btnConnectInputs = [Gtk.Button()]
-        self.boxComponentInputs.append(self.lblInputs)
-        self.boxComponentInputs.append(self.icovwInputs[0])
-        self.boxComponentInputs.append(self.btnConnectInputs[0])
+        self.lstInputs = Gio.ListStore.new(PortListItem)
+        self.lstvwInputs = Gtk.ListView.new(
+            Gtk.NoSelection.new(self.lstInputs),
+            self.factoryPorts)
+        self.lblNoInputs = Gtk.Label(label='None')
+        self.lblNoInputs.set_margin_top(10)
+        pack_box(self.boxComponentInputs, self.lblInputs, self.lstvwInputs, self.lblNoInputs)
 
         self.boxComponentOutputs = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         self.boxComponentOutputs.set_halign(Gtk.Align.FILL)
         self.boxComponentOutputs.set_hexpand(True)
         self.lblOutputs = Gtk.Label()
         self.lblOutputs.set_markup('<b>Outputs</b>')
-        self.icovwOutputs = [Gtk.IconView()]
-        self.btnConnectOutputs = [Gtk.Button()]
-        self.boxComponentOutputs.append(self.lblOutputs)
-        self.boxComponentOutputs.append(self.icovwOutputs[0])
-        self.boxComponentOutputs.append(self.btnConnectOutputs[0])
-
-        # Labels for when there is no input or output
-        self.lblNoInputs = Gtk.Label(label='None')
+        self.lstOutputs = Gio.ListStore.new(PortListItem)
+        self.lstvwOutputs = Gtk.ListView.new(
+            Gtk.NoSelection.new(self.lstOutputs),
+            self.factoryPorts)
         self.lblNoOutputs = Gtk.Label(label='None')
-        self.lblNoInputs.set_margin_top(10)
+        self.lblNoOutputs.set_margin_top(10)
+        pack_box(self.boxComponentOutputs, self.lblOutputs, self.lstvwOutputs, self.lblNoOutputs)
 
         # Pack the outer box
-        self.boxComponentConnections.append(self.boxComponentInputs)
-        self.boxComponentConnections.append(self.boxComponentOutputs)
+        pack_box(self.boxComponentConnections, self.boxComponentInputs, self.boxComponentOutputs)
         self.boxComponentDetails.append(self.boxComponentConnections)
 
         # Component errors
@@ -928,18 +1187,18 @@ class MainWindow(Gtk.ApplicationWindow):
         self.lblComponentErrorsHeader = Gtk.Label()
         self.lblComponentErrorsHeader.set_markup('<b>Simulation Errors</b>')
         self.lblComponentErrors = []
-        self.boxComponentDetails.append(self.lblComponentErrorsHeader)
-        self.boxComponentDetails.append(self.boxComponentErrors)
+        pack_box(self.boxComponentDetails, self.lblComponentErrorsHeader, self.boxComponentErrors)
 
         # Box to contain the build cost recipe for the component
         self.boxComponentRecipe = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         self.lblComponentRecipe = Gtk.Label()
         self.lblComponentRecipe.set_markup('<b>Component Build Cost</b>')
         self.lblComponentRecipe.set_margin_top(10) # Put a little visual space here
-        self.icovwComponentRecipe = Gtk.IconView()
-        self.icovwComponentRecipe.set_item_orientation(Gtk.Orientation.HORIZONTAL)
-        self.boxComponentRecipe.append(self.lblComponentRecipe)
-        self.boxComponentRecipe.append(self.icovwComponentRecipe)
+        self.lstComponentRecipe = Gio.ListStore.new(IngredientListItem)
+        self.lstvwComponentRecipe = Gtk.ListView.new(
+            Gtk.NoSelection.new(self.lstComponentRecipe),
+            self.factoryIngredients)
+        pack_box(self.boxComponentRecipe, self.lblComponentRecipe, self.lstvwComponentRecipe)
         self.boxComponentDetails.append(self.boxComponentRecipe)
 
         # A grid of tag data and widgets (which mostly gets set up in update_window calls)
@@ -952,8 +1211,7 @@ class MainWindow(Gtk.ApplicationWindow):
         # Button to delete the component
         self.sepDangerZone = Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL)
         self.btnDeleteComponent = Gtk.Button(label='Delete Component')
-        self.boxComponentDetails.append(self.sepDangerZone)
-        self.boxComponentDetails.append(self.btnDeleteComponent)
+        pack_box(self.boxComponentDetails, self.sepDangerZone, self.btnDeleteComponent)
 
         # Add it all to the scrollwindow
         self.scrollComponentDetails.set_child(self.boxComponentDetails)
@@ -968,8 +1226,9 @@ class MainWindow(Gtk.ApplicationWindow):
         self.__build_factory_context_panel()
         self.paneContext.set_start_child(self.scrollFactoryFunctions)
 
-        self.__build_component_context_panel()
-        self.paneContext.set_end_child(self.scrollComponentDetails)
+        # The component details panel gets built the first time a component is selected
+        self.boxComponentPlaceholder = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+        self.paneContext.set_end_child(self.boxComponentPlaceholder)
         self.paneContext.set_position(100)
 
     def __build_factory_context_panel(self):
@@ -977,61 +1236,33 @@ class MainWindow(Gtk.ApplicationWindow):
         Builds the right-side panel containing factory details.
         '''
 
-        # Wrap everything in a scrollwindow
-        self.scrollFactoryFunctions = Gtk.ScrolledWindow()
+        # The static widgets come from the .ui file
+        self.scrollFactoryFunctions = self.builder.get_object('scrollFactoryFunctions')
 
         # Contain all the factory-level functions within a box so they can all be enabled and
         # disabled by doing so to this one widget
-        self.boxFactoryFunctions = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-        self.boxFactoryFunctions.set_spacing(5)
-        self.boxFactoryFunctions.set_margin_start(5)
-        self.boxFactoryFunctions.set_margin_end(5)
-        self.boxFactoryFunctions.set_margin_bottom(5)
-        self.boxFactoryFunctions.set_margin_top(5)
+        self.boxFactoryFunctions = self.builder.get_object('boxFactoryFunctions')
         self.boxFactoryFunctions.set_sensitive(True if self.blueprint else False)
+        self.lblFactoryHeader = self.builder.get_object('lblFactoryHeader')
+
+        # The text box showing the name of the factory
+        self.boxFactoryName = self.builder.get_object('boxFactoryName')
+        self.lblFactoryName = self.builder.get_object('lblFactoryName')
+        self.entryFactoryName = self.builder.get_object('entryFactoryName')
+
+        # The controls allowing tier/upgrade selection
+        self.boxTierUpgrade = self.builder.get_object('boxTierUpgrade')
+        self.lblTierUpgrade = self.builder.get_object('lblTierUpgrade')
+        self.lblTierUpgradeSlash = self.builder.get_object('lblTierUpgradeSlash')
+
+        # The "Tier" drop down shows the shared model of satisfactory.base.Availability's tiers
+        self.drpTier = self.builder.get_object('drpTier')
+        self.drpTier.set_model(TIER_MODEL)
+        self.drpTier.set_selected(0)
 
-        # Place a header
-        self.lblFactoryHeader = Gtk.Label()
-        self.lblFactoryHeader.set_markup('<b>Factory Details</b>')
-        self.boxFactoryFunctions.append(self.lblFactoryHeader)
-
-        # Build the text box showing the name of the factory
-        self.boxFactoryName = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-        self.boxFactoryName.set_hexpand(True)
-        self.boxFactoryName.set_spacing(5)
-        self.lblFactoryName = Gtk.Label(label='Factory Name:')
-        self.lblFactoryName.set_margin_start(5)
-        self.entryFactoryName = Gtk.Entry()
-        self.entryFactoryName.set_hexpand(True)
-        self.boxFactoryName.append(self.lblFactoryName)
-        self.boxFactoryName.append(self.entryFactoryName)
-        self.boxFactoryFunctions.append(self.boxFactoryName)
-
-        # Build the controls allowing tier/upgrade selection
-        self.boxTierUpgrade = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-        self.boxTierUpgrade.set_spacing(5)
-        self.lblTierUpgrade = Gtk.Label(label='Tier/Upgrade:')
-        self.lblTierUpgrade.set_margin_start(5)
-        self.boxTierUpgrade.append(self.lblTierUpgrade)
-
-        # The "Tier" combo box is populated from the satisfactory.base.Availability class
-        self.cboTier = Gtk.ComboBoxText()
-        for tier in Availability.get_tier_strings():
-            self.cboTier.append(tier, tier)
-        self.cboTier.set_active(0)
-        self.boxTierUpgrade.append(self.cboTier)
-
-        # The "/" character between the combo boxes
-        self.lblTierUpgradeSlash = Gtk.Label(label='/')
-        self.boxTierUpgrade.append(self.lblTierUpgradeSlash)
-
-        # The "Upgrade" combo box gets populated based on the "Tier" selection
-        self.cboUpgrade = Gtk.ComboBoxText()
-        self.__cboTier_changed(self.cboUpgrade)
-        self.boxTierUpgrade.append(self.cboUpgrade)
-
-        self.boxFactoryFunctions.append(self.boxTierUpgrade)
-        self.scrollFactoryFunctions.set_child(self.boxFactoryFunctions)
+        # The "Upgrade" combo box gets populated based on the "Tier" selection, which happens in
+        # set_tier_and_upgrade whenever the window is updated with a blueprint
+        self.cboUpgrade = self.builder.get_object('cboUpgrade')
 
     def __build_factory_designer(self):
         '''
@@ -1047,70 +1278,119 @@ class MainWindow(Gtk.ApplicationWindow):
         Builds the UI controls which run across the top bar of the window.
         '''
 
-        # The bar's top level object is a horizontal box with some padding
-        self.boxTopBar = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-        self.boxTopBar.set_spacing(10)
-        self.boxTopBar.set_margin_top(10)
-        self.boxTopBar.set_margin_bottom(10)
-        self.boxTopBar.set_margin_start(10)
-        self.boxTopBar.set_margin_end(10)
-
-        # Build the "New" button
-        self.btnNewFactory = Gtk.Button()
-        self.btnNewFactory.set_icon_name('document-new')
-
-        # Build the "Open" button
-        self.btnOpenFactory = Gtk.Button()
-        self.btnOpenFactory.set_icon_name('document-open')
-
-        # Build the "Save" button
-        self.btnSaveFactory = Gtk.Button()
-        self.btnSaveFactory.set_icon_name('document-save')
-
-        # Build the "Save As" button
-        self.btnSaveFactoryAs = Gtk.Button()
-        self.btnSaveFactoryAs.set_icon_name('document-save-as')
-
-        # Build the "Simulate" and "Clean" buttons
-        self.btnSimulate = Gtk.Button()
-        self.btnSimulate.set_icon_name('media-playback-start')
-        self.btnSimulate.set_margin_start(20)
-        self.btnPurge = Gtk.Button()
-        self.btnPurge.set_icon_name('edit-clear')
-
-        # Add all the buttons to the main hbox
-        self.boxTopBar.append(self.btnNewFactory)
-        self.boxTopBar.append(self.btnOpenFactory)
-        self.boxTopBar.append(self.btnSaveFactory)
-        self.boxTopBar.append(self.btnSaveFactoryAs)
-        self.boxTopBar.append(self.btnSimulate)
-        self.boxTopBar.append(self.btnPurge)
+        # The whole bar is static, so it all comes from the .ui file
+        self.boxTopBar = self.builder.get_object('boxTopBar')
+        self.btnNewFactory = self.builder.get_object('btnNewFactory')
+        self.btnOpenFactory = self.builder.get_object('btnOpenFactory')
+        self.btnSaveFactory = self.builder.get_object('btnSaveFactory')
+        self.btnSaveFactoryAs = self.builder.get_object('btnSaveFactoryAs')
+        self.btnSimulate = self.builder.get_object('btnSimulate')
+        self.btnPurge = self.builder.get_object('btnPurge')
 
         return self.boxTopBar
 
+    def __build_port_list_items(self,
+        component: Component,
+        connections: list[Connection]
+    ) -> list[PortListItem]:
+        '''
+        Builds a row for each of a component's inputs or outputs, describing what flows through it.
+        '''
+
+        items = []
+        for i, connection in enumerate(connections):
+            label = '\n'.join([ f'{ingredient.rate}x {ingredient.item.name} /m'
+                for ingredient in connection.ingredients ])
+            image_file = None
+            if connection.ingredients:
+                image_file = self.get_component_image_file(
+                    connection.ingredients[0].item.programmatic_name())
+            items.append(PortListItem(component, connection, i, label, image_file))
+        return items
+
     def __build_ui_helpers(self):
         '''
         Builds reusable items which are unique to this application
         '''
 
-        # Populate the special resource node settings widgets and show them.
-        # Those items should be ones that can be produced by miner recipes.
-        miner_recipes = [ (recipe_name, recipe) for recipe_name, recipe in get_all_recipes()
-            if recipe.building_type == BuildingType.MINER ]
-        node_items = []
-        for _, recipe in miner_recipes:
-            node_items.extend([ ingredient.item.programmatic_name() \
-                for ingredient in recipe.produces])
-        self.node_items = sorted(set(node_items))
-
-        self.purities = [ purity[1] for purity in Purity.__members__.items() ]
+        # List the component images once, rather than checking for each image file as it's needed
+        try:
+            self.component_images = { entry.name
+                for entry in os.scandir(COMPONENT_IMAGE_FILE_PATH) }
+        except FileNotFoundError:
+            logging.warning(f'No component images found at {COMPONENT_IMAGE_FILE_PATH}')
+            self.component_images = set()
 
         self.satFileFilter = Gtk.FileFilter()
         self.satFileFilter.set_name('Satisfactory Blueprints (*.sat)')
         self.satFileFilter.add_pattern('*.sat')
         self.fileFilters = Gio.ListStore.new(Gtk.FileFilter)
         self.fileFilters.append(self.satFileFilter)
-        self.__load_images()
+
+        # The file dialogs are reused rather than rebuilt on every click
+        self.dlgOpenFactory = Gtk.FileDialog()
+        self.dlgOpenFactory.set_title('Open Factory')
+        self.dlgOpenFactory.set_filters(self.fileFilters)
+        self.dlgOpenFactory.set_default_filter(self.satFileFilter)
+        self.dlgSaveFactory = Gtk.FileDialog()
+        self.dlgSaveFactory.set_title('Save Factory...')
+        self.dlgSaveFactory.set_filters(self.fileFilters)
+        self.dlgSaveFactory.set_default_filter(self.satFileFilter)
+        self.dlgSaveFactoryAs = Gtk.FileDialog()
+        self.dlgSaveFactoryAs.set_title('Save Factory As...')
+        self.dlgSaveFactoryAs.set_filters(self.fileFilters)
+        self.dlgSaveFactoryAs.set_default_filter(self.satFileFilter)
+
+    def __connect_component_handlers(self):
+        '''
+        Connects signals for the widgets in the component details panel. Like that panel, this only
+        happens the first time a component gets selected. These signals are registered to the
+        windowSignals list along with all the others.
+        '''
+
+        self.windowSignals.extend([
+            # Signals for component detail widgets
+            (self.entryComponentName.get_buffer(),
+                self.entryComponentName.get_buffer().connect_after('deleted-text',
+                    self.__entryComponentName_deleted)),
+            (self.entryComponentName.get_buffer(),
+                self.entryComponentName.get_buffer().connect_after('inserted-text',
+                    self.__entryComponentName_inserted)),
+            (self.spinComponentClockRate,
+                self.spinComponentClockRate.connect(
+                    'value-changed',
+                    self.__spinComponentClockRate_changed)),
+            (self.chkComponentConstructed,
+                self.chkComponentConstructed.connect_after('toggled',
+                    self.__chkComponentConstructed_toggled)),
+            (self.chkComponentStandby,
+                self.chkComponentStandby.connect_after('toggled',
+                    self.__chkComponentStandby_toggled)),
+            (self.cboComponentSelectedRecipe,
+                self.cboComponentSelectedRecipe.connect_after(
+                    'changed',
+                    self.__cboComponentSelectedRecipe_changed)),
+            (self.spinISNRecipeRate,
+                self.spinISNRecipeRate.connect_after(
+                    'value-changed',
+                    self.__spinISNRecipeRate_value_changed)),
+            (self.cboResourceNodeItem,
+                self.cboResourceNodeItem.connect_after(
+                    'changed',
+                    self.__cboResourceNodeItem_changed)),
+            (self.drpResourceNodePurity,
+                self.drpResourceNodePurity.connect_after(
+                    'notify::selected',
+                    self.__drpResourceNodePurity_selected)),
+            (self.cboISNRecipeItem,
+                self.cboISNRecipeItem.connect_after(
+                    'changed',
+                    self.__cboISNRecipeItem_changed)),
+
+            # Widgets in the "danger zone"
+            (self.btnDeleteComponent,
+                self.btnDeleteComponent.connect('clicked', self.__btnDeleteComponent_clicked)),
+        ])
 
     def __connect_handlers(self):
         '''
@@ -1162,91 +1442,33 @@ class MainWindow(Gtk.ApplicationWindow):
             (self.btnBuild,
                 self.btnBuild.connect('clicked', self.__btnBuild_clicked)),
 
-            # Signals for component detail widgets
+            # Signals for factory detail widgets
             (self.entryFactoryName.get_buffer(),
                 self.entryFactoryName.get_buffer().connect_after('deleted-text',
                     self.__entryFactoryName_deleted)),
             (self.entryFactoryName.get_buffer(),
                 self.entryFactoryName.get_buffer().connect('inserted-text',
                     self.__entryFactoryName_inserted)),
-            (self.cboTier,
-                self.cboTier.connect_after('changed', self.__cboTier_changed)),
+            (self.drpTier,
+                self.drpTier.connect_after('notify::selected', self.__drpTier_selected)),
             (self.cboUpgrade,
                 self.cboUpgrade.connect('changed', self.__cboUpgrade_changed)),
-            (self.entryComponentName.get_buffer(),
-                self.entryComponentName.get_buffer().connect_after('deleted-text',
-                    self.__entryComponentName_deleted)),
-            (self.entryComponentName.get_buffer(),
-                self.entryComponentName.get_buffer().connect_after('inserted-text',
-                    self.__entryComponentName_inserted)),
-            (self.spinComponentClockRate,
-                self.spinComponentClockRate.connect(
-                    'value-changed',
-                    self.__spinComponentClockRate_changed)),
-            (self.chkComponentConstructed,
-                self.chkComponentConstructed.connect_after('toggled',
-                    self.__chkComponentConstructed_toggled)),
-            (self.chkComponentStandby,
-                self.chkComponentStandby.connect_after('toggled',
-                    self.__chkComponentStandby_toggled)),
-            (self.cboComponentSelectedRecipe,
-                self.cboComponentSelectedRecipe.connect_after(
-                    'changed',
-                    self.__cboComponentSelectedRecipe_changed)),
-            (self.spinISNRecipeRate,
-                self.spinISNRecipeRate.connect_after(
-                    'value-changed',
-                    self.__spinISNRecipeRate_value_changed)),
-            (self.cboResourceNodeItem,
-                self.cboResourceNodeItem.connect_after(
-                    'changed',
-                    self.__cboResourceNodeItem_changed)),
-            (self.cboResourceNodePurity,
-                self.cboResourceNodePurity.connect_after(
-                    'changed',
-                    self.__cboResourceNodePurity_changed)),
-            (self.cboISNRecipeItem,
-                self.cboISNRecipeItem.connect_after(
-                    'changed',
-                    self.__cboISNRecipeItem_changed)),
-
-            # Widgets in the "danger zone"
-            (self.btnDeleteComponent,
-                self.btnDeleteComponent.connect('clicked', self.__btnDeleteComponent_clicked)),
         ])
 
-    def __load_images(self):
+    def __ensure_component_context_panel(self):
         '''
-        Load all images that get used in this window from disk and store them in memory.
+        Most of the time the window is open, nothing is selected. Rather than building the whole
+        component details panel up front, build it and connect its signals the first time it's
+        needed, swapping it in for the placeholder in the context pane.
         '''
 
-        pixbuf = Pixbuf()
-        self.pixelBuffers = {}
-        building_pixbufs = {}
-        item_pixbufs = {}
+        if self.component_panel_built:
+            return
 
-        # Load building pixel buffers
-        all_buildings = MainWindow.get_building_options()
-        for building in all_buildings:
-            imageFile = Path(f'./static/images/components/{building.__class__.__name__}.png')
-            if imageFile.exists():
-                #pb = pixbuf.new_from_file_at_size(str(imageFile), 64, 64)
-                pb = pixbuf.new_from_file_at_size(str(imageFile), 64, 64)
-            else:
-                pb = None
-            building_pixbufs[building.__class__.__name__] = pb
-        self.pixelBuffers['building_options'] = building_pixbufs
-
-        # Load item pixel buffers
-        all_items = get_all_items()
-        for itemname, item in all_items:
-            imageFile = Path(f'./static/images/components/{itemname}.png')
-            if imageFile.exists():
-                pb = pixbuf.new_from_file_at_size(str(imageFile), 32, 32)
-            else:
-                pb = None
-            item_pixbufs[itemname] = pb
-        self.pixelBuffers['items'] = item_pixbufs
+        self.__build_component_context_panel()
+        self.__connect_component_handlers()
+        self.paneContext.set_end_child(self.scrollComponentDetails)
+        self.component_panel_built = True
 
 
     # Signal Handlers
@@ -1319,11 +1541,7 @@ class MainWindow(Gtk.ApplicationWindow):
         '''
 
         if response:
-            dlgOpenFactory = Gtk.FileDialog()
-            dlgOpenFactory.set_title('Open Factory')
-            dlgOpenFactory.set_filters(self.fileFilters)
-            dlgOpenFactory.set_default_filter(self.satFileFilter)
-            dlgOpenFactory.open(self, None, self.__dlgOpenFactory_response)
+            self.dlgOpenFactory.open(self, None, self.__dlgOpenFactory_response)
 
     def __dlgOpenFactory_response(self, dlg, response):
         '''
@@ -1332,9 +1550,11 @@ class MainWindow(Gtk.ApplicationWindow):
 
         try:
             blueprintFile = dlg.open_finish(response)
-            self.load_blueprint(blueprintFile.get_path())
-        except Exception as ex:
-            print(f'[DEBUG] Couldn\'t open the blueprint: {ex}')
+        except GLib.Error as ex:
+            # This is also how the dialog reports being dismissed without choosing a file
+            logging.debug(f'No blueprint was chosen to open: {ex.message}')
+            return
+        self.load_blueprint(blueprintFile.get_path())
 
     # + "Save" button signal handlers
 
@@ -1343,28 +1563,19 @@ class MainWindow(Gtk.ApplicationWindow):
         The user has clicked the "Save" button
         '''
 
-        if self.unsaved_changes:
+        if self.unsaved_changes and not self.saving:
             if self.blueprintFile:
-                self.blueprint.save(self.blueprintFile)
-                self.unsaved_changes = False
-                self.set_window_title()
+                self.save_blueprint(self.blueprintFile)
             else:
-                dlgSaveFactory = Gtk.FileDialog()
-                dlgSaveFactory.set_title('Save Factory...')
-                dlgSaveFactory.set_filters(self.fileFilters)
-                dlgSaveFactory.set_default_filter(self.satFileFilter)
-                dlgSaveFactory.save(self, None, self.__dlgSaveFactoryAs_response)
+                self.dlgSaveFactory.save(self, None, self.__dlgSaveFactoryAs_response)
 
     def __btnSaveFactoryAs_clicked(self, btn):
         '''
         The user cliked the "Save As" button.
         '''
 
-        dlgSaveFactoryAs = Gtk.FileDialog()
-        dlgSaveFactoryAs.set_title('Save Factory As...')
-        dlgSaveFactoryAs.set_filters(self.fileFilters)
-        dlgSaveFactoryAs.set_default_filter(self.satFileFilter)
-        dlgSaveFactoryAs.save(self, None, self.__dlgSaveFactoryAs_response)
+        if not self.saving:
+            self.dlgSaveFactoryAs.save(self, None, self.__dlgSaveFactoryAs_response)
 
     def __dlgSaveFactoryAs_response(self, dlg, response):
         '''
@@ -1375,32 +1586,36 @@ class MainWindow(Gtk.ApplicationWindow):
 
         if response:
             try:
-                # Try the save first so we don't change the app context if it fails
-                blueprintFile = dlg.save_finish(response).get_path()
-                self.blueprint.save(blueprintFile)
-                self.blueprintFile = blueprintFile
-                self.unsaved_changes = False
-                self.update_window()
-            except IOError as ex:
-                print(f'[DEBUG] Error saving blueprint at file {blueprintFile}:\n  {ex}')
-                # TODO: Replace with real error dialog
-            except Exception as ex:
-                print(f'[DEBUG] Could not save the blueprint: {ex}')
+                blueprintFile = dlg.save_finish(response)
+            except GLib.Error as ex:
+                # This is also how the dialog reports being dismissed without choosing a file
+                logging.debug(f'No file was chosen to save the blueprint to: {ex.message}')
+                return
+            # The app context only changes once the save has succeeded
+            self.save_blueprint(blueprintFile.get_path())
 
     # + Simulate/Purge button signal handlers
 
-    def __btnSimulate_clicked(self, btn):
-        self.blueprint.factory.purge()
-        self.blueprint.factory.simulate()
+    def __run_factory_operations(self,
+        *operations: Callable
+    ):
+        '''
+        Runs each of the given operations on the factory, such as purging or simulating it, then
+        refreshes the window once. The operations change components' errors and badges, so the
+        blueprint's geometry is flagged to be recalculated on the next frame.
+        '''
+
+        for operation in operations:
+            operation()
         self.blueprint.invalidate_geometry()
         self.unsaved_changes = True
         self.update_window()
 
+    def __btnSimulate_clicked(self, btn):
+        self.__run_factory_operations(self.blueprint.factory.purge, self.blueprint.factory.simulate)
+
     def __btnPurge_clicked(self, btn):
-        self.blueprint.factory.purge()
-        self.blueprint.invalidate_geometry()
-        self.unsaved_changes = True
-        self.update_window()
+        self.__run_factory_operations(self.blueprint.factory.purge)
 
     # + Factory Name Entry signal handlers
 
@@ -1408,7 +1623,9 @@ class MainWindow(Gtk.ApplicationWindow):
         if text != self.blueprint.factory.name:
             self.blueprint.factory.name = text
             self.unsaved_changes = True
-            self.update_window(skip=[self.entryFactoryName])
+            self.schedule_update('factory_name',
+                lambda: self.update_window(skip=[self.entryFactoryName]),
+                ENTRY_UPDATE_DELAY_MS)
 
     def __entryFactoryName_deleted(self, buffer, position, chars):
         self.__entryFactoryName_changed(buffer.get_text())
@@ -1418,77 +1635,143 @@ class MainWindow(Gtk.ApplicationWindow):
 
     # + "Tier" combo box signal handlers
 
-    def __cboTier_changed(self, cbo):
+    def __drpTier_selected(self, drp, pspec):
         '''
-        The "Tier" combo box has had its value changed. We need to populate the "Upgrade" combo box
+        The "Tier" drop down has had its value changed. We need to populate the "Upgrade" combo box
         accordingly.
         '''
 
-        self.set_tier_and_upgrade(tier=cbo.get_active())
+        self.set_tier_and_upgrade(tier=drp.get_selected())
         self.update_buildings_list()
 
     # + "Upgrade" combo box signal handlers
 
     def __cboUpgrade_changed(self, cbo):
-        self.blueprint.factory.availability.upgrade = self.cboUpgrade.get_active() + 1
+        upgrade = self.cboUpgrade.get_active() + 1
+        if upgrade == self.blueprint.factory.availability.upgrade:
+            return
+        self.blueprint.factory.availability.upgrade = upgrade
         self.unsaved_changes = True
         self.update_window()
 
     # + Building option filters signal handlers
 
+    def __set_filter(self,
+        key: str,
+        value: bool
+    ) -> bool:
+        '''
+        Turns one of the building list filters on or off. Returns whether that changed anything, so
+        handlers can skip updating the window when the filter already had that value.
+        '''
+
+        if self.filters[key] == value:
+            return False
+        self.filters[key] = value
+        return True
+
     def __chkAvailability_toggled(self, chk):
-        self.filters['availability'] = chk.get_active()
-        self.update_window()
+        if self.__set_filter('availability', chk.get_active()):
+            self.update_window()
 
     def __chkBuildingCategory_toggled(self, chk):
-        self.filters['building_category'] = chk.get_active()
-        self.update_buildings_list()
+        if self.__set_filter('building_category', chk.get_active()):
+            self.update_buildings_list()
 
     def __cboBuildingCategory_changed(self, cbo):
         if self.filters['building_category']:
             self.update_buildings_list()
 
     def __chkNameFilter_toggled(self, chk):
-        self.filters['name'] = chk.get_active()
-        self.update_buildings_list()
+        if self.__set_filter('name', chk.get_active()):
+            self.update_buildings_list()
 
     def __entryNameFilter_deleted(self, buffer, position, chars):
         if self.filters['name']:
-            self.update_buildings_list()
+            self.schedule_update('name_filter', self.update_buildings_list, NAME_FILTER_DELAY_MS)
 
     def __entryNameFilter_inserted(self, buffer, position, chars, nchars):
         if self.filters['name']:
-            self.update_buildings_list()
+            self.schedule_update('name_filter', self.update_buildings_list, NAME_FILTER_DELAY_MS)
 
-    def __btnBuild_clicked(self, btn):
-        center_x = self.blueprint.viewport.region.left + (self.blueprint.viewport.region.width / 2)
-        center_x /= self.blueprint.viewport.scale
-        center_y = self.blueprint.viewport.region.top + (self.blueprint.viewport.region.height / 2)
-        center_y /= self.blueprint.viewport.scale
+    def __filterBuildings_match(self, item: BuildingListItem) -> bool:
+        '''
+        Determines whether a building should be shown in the buildings list, given the filter state
+        the list was last updated with.
+        '''
 
-        # Get the only selected item, which should be a class for the building, or do nothing
-        selected = self.icovwBuildings.get_selected_items()
-        if len(selected) > 0:
-            selected = selected[0].get_indices()[0]
+        if not self.buildings_filter_state:
+            return False
 
-            # Create a default instance of that kind of component and set it to be added to the
-            # blueprint when the user clicks somewhere there.
-            if self.buildings[selected] == ResourceNode:
-                new_component = self.buildings[selected](
-                    item=IronOre)
-            else:
-                new_component = self.buildings[selected]()
-            self.blueprint.add_component(new_component, self.blueprint.viewport.region.location)
-            self.blueprint.selected = new_component
+        availability, category, name = self.buildings_filter_state
 
-        self.update_window()
+        # Filter out anything the factory hasn't unlocked yet
+        if availability and item.filter_availability > availability:
+            return False
+
+        # Filter out anything that doesn't match the building category
+        if category and item.filter_category != category:
+            return False
+
+        # Filter out anything that doesn't match the name
+        if name and name not in item.filter_name:
+            return False
+
+        return True
+
+    def __factoryBuildings_setup(self, factory, list_item):
+        '''
+        Creates the widgets for one cell of the buildings grid. These get reused as the user scrolls.
+        '''
+
+        boxBuilding = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+        boxBuilding.set_spacing(5)
+        imgBuilding = Gtk.Image()
+        imgBuilding.set_pixel_size(64)
+        lblBuilding = Gtk.Label()
+        lblBuilding.set_wrap(True)
+        boxBuilding.append(imgBuilding)
+        boxBuilding.append(lblBuilding)
+        list_item.set_child(boxBuilding)
+
+    def __factoryBuildings_bind(self, factory, list_item):
+        '''
+        Fills a cell of the buildings grid with data about a building.
+        '''
+
+        item = list_item.get_item()
+        imgBuilding = list_item.get_child().get_first_child()
+        lblBuilding = imgBuilding.get_next_sibling()
+        # Images are only loaded once a building is actually shown, then cached
+        if item.image_file:
+            imgBuilding.set_from_paintable(get_texture_from_file(item.image_file))
+        lblBuilding.set_text(item.name)
+
+    def __factoryBuildings_unbind(self, factory, list_item):
+        '''
+        Clears a cell of the buildings grid so it can be reused.
+        '''
+
+        list_item.get_child().get_first_child().clear()
+
+    def __btnBuild_clicked(self, btn):
+        # Get the only selected item, which wraps an instance of the building, or do nothing
+        selected = self.selBuildings.get_selected_item()
+        if selected:
+            # Remember what kind of component to build. It only gets created and added to the
+            # blueprint when the user clicks somewhere there.
+            self.pending_build_class = selected.building.__class__
+            self.factoryDesigner.set_cursor_from_name('crosshair')
 
     # + Component detail widget signal handlers
 
     def __entryComponentName_changed(self, text):
-        self.blueprint.selected.name = text
-        self.unsaved_changes = True
-        self.update_window(skip=[self.entryComponentName])
+        if text != self.blueprint.selected.name:
+            self.blueprint.selected.name = text
+            self.unsaved_changes = True
+            self.schedule_update('component_name',
+                lambda: self.update_window(skip=[self.entryComponentName]),
+                ENTRY_UPDATE_DELAY_MS)
 
     def __entryComponentName_deleted(self, buffer, position, chars):
         if self.blueprint and self.blueprint.selected:
@@ -1500,195 +1783,281 @@ class MainWindow(Gtk.ApplicationWindow):
 
     def __spinComponentClockRate_changed(self, range):
         rate = round(self.spinComponentClockRate.get_value(), 2)
+        if rate == self.blueprint.selected.clock_rate:
+            return
         self.blueprint.selected.clock_rate = rate
         self.unsaved_changes = True
+        self.schedule_update('clock_rate', self.update_window, SPIN_UPDATE_DELAY_MS)
+
+    def __set_selected_component_flag(self,
+        flag: str,
+        value: bool
+    ):
+        '''
+        Sets a boolean flag, such as "constructed" or "standby", on the selected component. These
+        flags change the component's badges, so its geometry gets recalculated on the next window
+        update as well.
+        '''
+
+        selected = self.blueprint.selected if self.blueprint else None
+        if selected is None or getattr(selected, flag, None) == value:
+            return
+
+        setattr(selected, flag, value)
+        if not selected.is_conveyance:
+            self.dirty_geometry.add(selected.id)
+        self.unsaved_changes = True
         self.update_window()
-        # self.update_window(skip=[self.spinComponentClockRate])
 
     def __chkComponentConstructed_toggled(self, chk):
-        if self.blueprint and self.blueprint.selected:
-            self.blueprint.selected.constructed = chk.get_active()
-            if not isinstance(self.blueprint.selected, Conveyance):
-                geo = self.blueprint.geometry.get(self.blueprint.selected.id)
-                geo.calculate(
-                    scale=self.blueprint.viewport.scale,
-                    translate=self.blueprint.viewport.region.location)
-                # geo._ComponentGeometry__calculate_badges()
-            self.unsaved_changes = True
-            self.update_window()
+        self.__set_selected_component_flag('constructed', chk.get_active())
 
     def __chkComponentStandby_toggled(self, chk):
-        if self.blueprint and self.blueprint.selected:
-            self.blueprint.selected.standby = chk.get_active()
-            if not isinstance(self.blueprint.selected, Conveyance):
-                geo = self.blueprint.geometry.get(self.blueprint.selected.id)
-                geo.calculate(
-                    scale=self.blueprint.viewport.scale,
-                    translate=self.blueprint.viewport.region.location)
-                # geo._ComponentGeometry__calculate_badges()
-            self.unsaved_changes = True
-            self.update_window()
+        self.__set_selected_component_flag('standby', chk.get_active())
 
     def __cboComponentSelectedRecipe_changed(self, cbo):
         if self.blueprint and self.blueprint.selected \
             and isinstance(self.blueprint.selected, Building):
-                recipe_name = cbo.get_active_text().title().replace(' ', '')
-                try:
-                    recipe = [ recipe for name, recipe in get_all_recipes() \
-                        if name == recipe_name ][0]
+                recipe_name = cbo.get_active_id()
+                recipe = get_recipe_by_name(recipe_name)
+                if recipe is self.blueprint.selected.recipe:
+                    return
+                if recipe is not None:
                     self.blueprint.selected.recipe = recipe
                     self.unsaved_changes = True
                     self.update_window(skip=[self.cboComponentSelectedRecipe])
-                except IndexError:
+                else:
                     logging.debug(f'No recipe called {recipe_name} was found')
 
     def __spinISNRecipeRate_value_changed(self, spin):
         if self.blueprint and self.blueprint.selected:
             self.blueprint.selected.rate = spin.get_value()
             self.blueprint.unsaved_changes = True
-            self.update_window(skip=[self.spinISNRecipeRate])
+            self.schedule_update('isn_rate',
+                lambda: self.update_window(skip=[self.spinISNRecipeRate]),
+                SPIN_UPDATE_DELAY_MS)
 
     def __cboISNRecipeItem_changed(self, cbo):
         if self.blueprint and self.blueprint.selected \
             and isinstance(self.blueprint.selected, InfiniteSupplyNode):
-                item_name = cbo.get_active_text().title().replace(' ', '')
-                try:
-                    item = [ item for name, item in get_all_items() \
-                        if name == item_name ][0]
+                item_name = cbo.get_active_id()
+                item = get_item_by_name(item_name)
+                if item is self.blueprint.selected.item:
+                    return
+                if item is not None:
                     self.blueprint.selected.item = item
                     self.unsaved_changes = True
                     self.update_window(skip=[self.cboISNRecipeItem])
-                except IndexError:
+                else:
                     logging.debug(f'No item called {item_name} was found')
 
     def __cboResourceNodeItem_changed(self, cbo):
         if self.blueprint and self.blueprint.selected \
             and isinstance(self.blueprint.selected, ResourceNode):
                 item_name = cbo.get_active_id()
-                try:
-                    item = [ item for name, item in get_all_items() \
-                        if name == item_name][0]
+                item = get_item_by_name(item_name)
+                if item is self.blueprint.selected.item:
+                    return
+                if item is not None:
                     self.blueprint.selected.item = item
                     self.unsaved_changes = True
                     self.update_window(skip=[self.cboResourceNodeItem])
-                except IndexError:
+                else:
                     logging.debug(f'No item called {item_name} was found')
 
-    def __cboResourceNodePurity_changed(self, cbo):
+    def __drpResourceNodePurity_selected(self, drp, pspec):
         if self.blueprint and self.blueprint.selected \
             and isinstance(self.blueprint.selected, ResourceNode):
-                purity_name = cbo.get_active_id()
-                try:
-                    purity = [ purity for name, purity in Purity.__members__.items()
-                        if name == purity_name ][0]
-                    self.blueprint.selected.purity = purity
+                purity_index = drp.get_selected()
+                if purity_index < len(PURITIES):
+                    if PURITIES[purity_index] is self.blueprint.selected.purity:
+                        return
+                    self.blueprint.selected.purity = PURITIES[purity_index]
                     self.unsaved_changes = True
-                    self.update_window(skip=[self.cboResourceNodePurity])
-                except IndexError:
-                    logging.debug(f'No item called {item_name} was found')
+                    self.update_window(skip=[self.drpResourceNodePurity])
+                else:
+                    logging.debug(f'No purity at position {purity_index} was found')
+
+    def __factoryIngredients_setup(self, factory, list_item):
+        '''
+        Creates the widgets for one row of an ingredient list. These get reused between updates.
+        '''
+
+        boxIngredient = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
+        boxIngredient.set_spacing(5)
+        imgIngredient = Gtk.Image()
+        imgIngredient.set_pixel_size(32)
+        lblIngredient = Gtk.Label()
+        boxIngredient.append(imgIngredient)
+        boxIngredient.append(lblIngredient)
+        list_item.set_child(boxIngredient)
 
-    def __btnConnection_clicked(self, btn):
+    def __factoryIngredients_bind(self, factory, list_item):
+        '''
+        Fills a row of an ingredient list with data about the ingredient.
+        '''
+
+        item = list_item.get_item()
+        imgIngredient = list_item.get_child().get_first_child()
+        lblIngredient = imgIngredient.get_next_sibling()
+        if item.image_file:
+            imgIngredient.set_from_paintable(get_texture_from_file(item.image_file))
+        lblIngredient.set_text(item.label)
+
+    def __factoryIngredients_unbind(self, factory, list_item):
+        '''
+        Clears a row of an ingredient list so it can be reused.
+        '''
+
+        list_item.get_child().get_first_child().clear()
+
+    def __factoryPorts_setup(self, factory, list_item):
+        '''
+        Creates the widgets for one input or output row. The button looks up whichever port the row
+        is bound to at the time it's clicked, so it only has to be connected once.
+        '''
+
+        boxPort = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
+        boxPort.set_spacing(5)
+        imgPort = Gtk.Image()
+        imgPort.set_pixel_size(32)
+        lblPort = Gtk.Label()
+        lblPort.set_hexpand(True)
+        lblPort.set_xalign(0)
+        btnConnection = Gtk.Button(label='Manage...')
+        btnConnection.connect('clicked', self.__btnConnection_clicked, list_item)
+        pack_box(boxPort, imgPort, lblPort, btnConnection)
+        list_item.set_child(boxPort)
+
+    def __factoryPorts_bind(self, factory, list_item):
+        '''
+        Fills an input or output row with data about the port.
+        '''
+
+        item = list_item.get_item()
+        imgPort = list_item.get_child().get_first_child()
+        lblPort = imgPort.get_next_sibling()
+        if item.image_file:
+            imgPort.set_from_paintable(get_texture_from_file(item.image_file))
+        lblPort.set_text(item.label)
+
+    def __factoryPorts_unbind(self, factory, list_item):
+        '''
+        Clears an input or output row so it can be reused.
+        '''
+
+        list_item.get_child().get_first_child().clear()
+
+    def __btnConnection_clicked(self, btn, list_item):
+        port = list_item.get_item()
         wdwConnection = ConnectionManagementWindow(
             self,
-            btn.tags['component'],
-            btn.tags['connection'],
-            btn.tags['connection_index'],
+            port.component,
+            port.connection,
+            port.connection_index,
             self.__wdwConnection_closed)
 
-    def __wdwConnection_closed(self, response: ConnectionManagementWindowResponse):
-        # If a change is to be made, dig up the things the response indicates
-        if response.changed:
-            self.blueprint.draw_locked = True
-            source_component = None
-            source_conn = None
-            target_component = None
-            target_conn = None
-            old_target_component = None
-            old_target_conn = None
-
-            # Get the source component and connection objects
-            if None not in [response.source_component_id, response.source_connection_index]:
-                source_component = self.blueprint.factory.get_component_by_id(
-                    response.source_component_id)
-                source_connections = source_component.outputs \
-                    if response.source_connection_is_output \
-                    else source_component.inputs
-                source_conn = source_connections[response.source_connection_index]
-
-            # Get the target component and connection objects
-            if None not in [response.target_component_id, response.target_connection_index]:
-                target_component = self.blueprint.factory.get_component_by_id(
-                    response.target_component_id)
-                target_connections = target_component.inputs \
-                    if response.source_connection_is_output \
-                    else target_component.outputs
-                target_conn = target_connections[response.target_connection_index]
-
-            # Get the old target component and connection objects
-            if None not in [response.old_target_component_id, response.old_target_connection_index]:
-                old_target_component = self.blueprint.factory.get_component_by_id(
-                    response.old_target_component_id)
-                old_target_connections = old_target_component.inputs \
-                    if response.source_connection_is_output \
-                        else old_target_component.outputs
-                old_target_conn = old_target_connections[response.old_target_connection_index]
-
-            # If the connection hasn't changed...
-            if old_target_conn is not None and old_target_conn == target_conn:
-                # If the conveyance type hasn't changed...
-                if response.conveyance_class == type(source_conn.remote.attached_to):
-                    # Then don't do anything, only unlock the drawing routines
-                    self.blueprint.draw_locked = False
-                    return
+    def __get_response_connection(self,
+        component_id: str,
+        connection_index: int,
+        is_output: bool
+    ) -> tuple[Component, Connection]:
+        '''
+        Looks up a component and one of its connections, as identified by a connection management
+        window's response. Returns `(None, None)` if the response doesn't identify one.
+
+            - component_id: The ID of the component
+            - connection_index: The index of the connection in the component's inputs or outputs
+            - is_output: True to look up one of the component's outputs, False for an input
+        '''
 
-            # If there's an existing connection, we have to detect it and get rid of it
-            old_conveyance = None
-            if old_target_component is not None:
-                # If the connection isn't between a miner and resource node, then there is a
-                # conveyance we need to delete before building the new connection.
-                if not (issubclass(source_component.__class__, Miner) and source_conn.is_input()) \
-                    and not isinstance(source_component, ResourceNode):
+        if component_id is None or connection_index is None:
+            return None, None
+        component = self.blueprint.factory.get_component_by_id(component_id)
+        connections = component.outputs if is_output else component.inputs
+        return component, connections[connection_index]
+
+    def __wdwConnection_closed(self, response: ConnectionManagementWindowResponse):
+        # Batch the changes so the window is only updated once they've all been made
+        with self.batch_updates():
+            # If a change is to be made, dig up the things the response indicates
+            if response.changed:
+                self.blueprint.draw_locked = True
+                source_is_output = response.source_connection_is_output
+                source_component, source_conn = self.__get_response_connection(
+                    response.source_component_id,
+                    response.source_connection_index,
+                    source_is_output)
+                target_component, target_conn = self.__get_response_connection(
+                    response.target_component_id,
+                    response.target_connection_index,
+                    not source_is_output)
+                old_target_component, old_target_conn = self.__get_response_connection(
+                    response.old_target_component_id,
+                    response.old_target_connection_index,
+                    not source_is_output)
+
+                # If the connection hasn't changed...
+                if old_target_conn is not None and old_target_conn == target_conn:
+                    # If the conveyance type hasn't changed...
+                    if response.conveyance_class == type(source_conn.remote.attached_to):
+                        # Then don't do anything, only unlock the drawing routines
+                        self.blueprint.draw_locked = False
+                        return
+
+                # Work out once whether this is a Miner/ResourceNode pairing, which is connected
+                # directly instead of through a conveyance
+                source_is_miner = source_component is not None and source_component.is_miner
+                source_is_node = source_component is not None and source_component.is_resource_node
+                target_is_miner = target_component is not None and target_component.is_miner
+                target_is_node = target_component is not None and target_component.is_resource_node
+
+                # If there's an existing connection, we have to detect it and get rid of it
+                old_conveyance = None
+                if old_target_component is not None:
+                    # If the connection isn't between a miner and resource node, then there is a
+                    # conveyance we need to delete before building the new connection.
+                    if not (source_is_miner and source_conn.is_input()) and not source_is_node:
                         old_conveyance, *_ = source_conn.connected_to()
 
-                # Clear that conveyance out of everywhere we store info about it.
-                if old_conveyance is not None:
-                    old_conveyance.inputs[0].source.target = None
-                    old_conveyance.outputs[0].target.source = None
-                    self.blueprint.remove_component(old_conveyance.id)
-                else:
-                    # There is no conveyance between the source and existing target. Just disconnect
-                    # them manually.
-                    if source_conn.is_output():
-                        source_conn.target.source = None
-                        source_conn.target = None
+                    # Clear that conveyance out of everywhere we store info about it.
+                    if old_conveyance is not None:
+                        old_conveyance.inputs[0].source.target = None
+                        old_conveyance.outputs[0].target.source = None
+                        self.blueprint.remove_component(old_conveyance.id)
                     else:
-                        source_conn.source.target = None
-                        source_conn.source = None
-
-            # If the response indicates a connection to be made, create that connection
-            if source_conn and target_conn:
-                # If the connection is between a miner and resource node, connect them directly
-                if issubclass(source_component.__class__, Miner) and \
-                    isinstance(target_component, ResourceNode):
-                        source_conn.connect(target_conn)
-                elif isinstance(source_component, ResourceNode) and \
-                    issubclass(target_component.__class__, Miner):
+                        # There is no conveyance between the source and existing target. Just
+                        # disconnect them manually.
+                        if source_conn.is_output():
+                            source_conn.target.source = None
+                            source_conn.target = None
+                        else:
+                            source_conn.source.target = None
+                            source_conn.source = None
+
+                # If the response indicates a connection to be made, create that connection
+                if source_conn and target_conn:
+                    # If the connection is between a miner and resource node, connect them directly
+                    if (source_is_miner and target_is_node) or (source_is_node and target_is_miner):
                         source_conn.connect(target_conn)
-                # If the connection is between any other kind of component, connect them using a conveyance
-                else:
-                    new_conveyance = response.conveyance_class()
-                    if response.source_connection_is_output:
-                        source_conn.connect(new_conveyance.inputs[0])
-                        new_conveyance.outputs[0].connect(target_conn)
+                    # If the connection is between any other kind of component, connect them using
+                    # a conveyance
                     else:
-                        source_conn.connect(new_conveyance.outputs[0])
-                        new_conveyance.inputs[0].connect(target_conn)
-                    self.blueprint.add_component(new_conveyance, Coordinate2D())
-
-        # Make sure the changes get drawn
-        self.blueprint.invalidate_geometry()
-        self.blueprint.draw_locked = False
-        self.factoryDesigner.queue_draw()
+                        new_conveyance = response.conveyance_class()
+                        if source_is_output:
+                            source_conn.connect(new_conveyance.inputs[0])
+                            new_conveyance.outputs[0].connect(target_conn)
+                        else:
+                            source_conn.connect(new_conveyance.outputs[0])
+                            new_conveyance.inputs[0].connect(target_conn)
+                        self.blueprint.add_component(new_conveyance, Coordinate2D())
+
+                self.unsaved_changes = True
+
+            # Make sure the changes get drawn
+            self.blueprint.invalidate_geometry()
+            self.blueprint.draw_locked = False
+            self.update_window()
 
     # + Component tagging widget signal handlers
 
@@ -1706,31 +2075,42 @@ class MainWindow(Gtk.ApplicationWindow):
                 f'Delete {self.blueprint.selected.name}?',
                 self.__dlgConfirmComponentDelete_responded)
 
+    def __disconnect_conveyance(self,
+        remote: Connection,
+        to_remove: set[str]
+    ):
+        '''
+        Given the far end of one of a component's connections, which should belong to a conveyance,
+        disconnects that conveyance from whatever is on its other side and adds it to the set of
+        components to remove.
+        '''
+
+        if remote is None or remote.attached_to is None:
+            return
+        conveyance = remote.attached_to
+        if remote.is_output():
+            # The conveyance carries items into the component; detach it from its source
+            conveyance.inputs[0].source.attached_to.outputs[0].target = None
+        else:
+            # The conveyance carries items out of the component; detach it from its target
+            conveyance.outputs[0].target.attached_to.inputs[0].source = None
+        to_remove.add(conveyance.id)
+
     def __dlgConfirmComponentDelete_responded(self, confirmed: bool):
         if confirmed and self.blueprint and self.blueprint.selected:
             comp = self.blueprint.selected
 
-            # Delete any conveyances connecting the components' connections
-            for conn in comp.inputs:
-                source_output = conn.source
-                if source_output:
-                    attached_to = source_output.attached_to
-                    # attached_to should be a conveyance. We need to find what that's connected to
-                    if attached_to:
-                        source_building = attached_to.inputs[0].source.attached_to
-                        source_building.outputs[0].target = None
-                        self.blueprint.remove_component(attached_to.id)
-            for conn in comp.outputs:
-                target_input = conn.target
-                if target_input:
-                    attached_to = conn.target.attached_to
-                    if attached_to:
-                        target_building = attached_to.outputs[0].target.attached_to
-                        target_building.inputs[0].source = None
-                        self.blueprint.remove_component(attached_to.id)
-
-            # Delete the component itself, deselect everything, update the window
-            self.blueprint.remove_component(comp.id)
-            self.blueprint.selected = None
-            self.unsaved_changes = True
-            self.update_window()
+            with self.batch_updates():
+                # Disconnect any conveyances connecting the components' connections, then delete
+                # them along with the component itself
+                to_remove = { comp.id }
+                for conn in comp.inputs:
+                    self.__disconnect_conveyance(conn.source, to_remove)
+                for conn in comp.outputs:
+                    self.__disconnect_conveyance(conn.target, to_remove)
+                self.blueprint.remove_components(to_remove)
+
+                # Deselect everything, update the window
+                self.blueprint.selected = None
+                self.unsaved_changes = True
+                self.update_window()
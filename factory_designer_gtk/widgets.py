@@ -6,8 +6,8 @@ gi.require_version('Gdk', '4.0')
 gi.require_version('Gtk', '4.0')
 
 from enum import Enum
-from gi.repository import Gdk, Gtk, Gio, GObject
-from pathlib import Path
+from functools import lru_cache
+from gi.repository import Gdk, Gtk, Gio, GLib, GObject
 from satisfactory import (
     base,
     buildings,
@@ -25,9 +25,14 @@ from typing import Any, Callable
 
 # These functions provide support for testing and the widgets in this file
 
-def build_test_blueprint():
+def build_test_blueprint(*,
+    simulate: bool = True
+):
     '''
     Builds a simple blueprint that we can test with
+
+        - simulate: Whether to simulate the factory before returning it. Skip this when only the
+            layout and connections of the blueprint matter.
     '''
 
     # Build the factory components
@@ -71,36 +76,172 @@ def build_test_blueprint():
     blueprint.add_component(convSmelterToConstructor, geometry.Coordinate2D())
     blueprint.add_component(storage, geometry.Coordinate2D(630, 20))
     blueprint.add_component(convConstructorToStorage, geometry.Coordinate2D())
-    blueprint.factory.simulate()
+    if simulate:
+        blueprint.factory.simulate()
     return blueprint
 
+def pack_box(
+    box: Gtk.Box,
+    *children: Gtk.Widget
+):
+    '''
+    Appends each of the children to the box, in order. Property notifications on the box are held
+    until all of them have been added, so they go out once instead of once per child.
+    '''
+
+    box.freeze_notify()
+    for child in children:
+        box.append(child)
+    box.thaw_notify()
+
+def fill_combo_box(
+    combo: Gtk.ComboBoxText,
+    options: list[tuple[str, str]]
+):
+    '''
+    Replaces the contents of a Gtk.ComboBoxText with the given (id, text) pairs. This inserts rows
+    straight into the combo box's underlying Gtk.ListStore, which is much faster than calling
+    `append` on the combo box once per option.
+
+        - combo: The combo box to fill
+        - options: A list of (id, text) tuples, in the order they should be shown
+    '''
+
+    # A ComboBoxText's model has the display text in column 0 and the ID in column 1
+    store = combo.get_model()
+    store.freeze_notify()
+    store.clear()
+    for option_id, option_text in options:
+        store.insert_with_values(-1, (0, 1), (option_text, option_id))
+    store.thaw_notify()
+
+# Textures used to draw blueprints, keyed by (category, key). These are shared by every widget
+# so that a new or recreated widget doesn't have to build its own set.
+TEXTURES = {}
+
+# The factory designer draws every pixel of itself, so there's no need for GTK to draw any of the
+# theme's decorations or run its transitions for the widget. This style strips them, and is added
+# to the display the first time a designer widget is created.
+DESIGNER_CSS_CLASS = 'factory-designer'
+DESIGNER_CSS = f'''
+.{DESIGNER_CSS_CLASS} {{
+    background: none;
+    border: none;
+    border-radius: 0;
+    box-shadow: none;
+    outline: none;
+    transition: none;
+}}
+'''
+DESIGNER_CSS_PROVIDER = None
+
+def install_designer_css(display: Gdk.Display):
+    '''
+    Makes the factory designer's style available to every widget on the display, once.
+    '''
+
+    global DESIGNER_CSS_PROVIDER
+    if DESIGNER_CSS_PROVIDER is None:
+        DESIGNER_CSS_PROVIDER = Gtk.CssProvider()
+        DESIGNER_CSS_PROVIDER.load_from_string(DESIGNER_CSS)
+        Gtk.StyleContext.add_provider_for_display(
+            display, DESIGNER_CSS_PROVIDER, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
+
+@lru_cache(maxsize=1024)
 def get_texture_from_file(filename: str) -> Gdk.Texture:
     '''
-    Given the filename of an image, returns a Gdk.Texture object for it
+    Given the filename of an image, returns a Gdk.Texture object for it. Results are cached, so each
+    image is only read from disk and uploaded once no matter how many widgets display it. Returns
+    None if the image can't be loaded.
     '''
-    if Path(filename).exists():
-        texture = Gdk.Texture.new_from_filename(filename)
-        return texture
 
-    return None
+    try:
+        return Gdk.Texture.new_from_filename(filename)
+    except GLib.Error as ex:
+        logging.debug(f'Unable to load texture from {filename}: {ex}')
+        return None
 
 
 # These classes provide support to the widgets in this file
 
+class BuildingListItem(GObject.Object):
+    '''
+    Wraps one of the buildings a user can choose to build so that it can be stored in a
+    Gio.ListStore and displayed by a list or grid view.
+
+        - building: A default instance of the building
+        - image_file: Path to the image to display for the building; it is loaded when first shown
+
+    The values the buildings list gets filtered on are worked out once here, so that filtering the
+    list is a few plain comparisons per building.
+    '''
+
+    name = GObject.Property(type=str, default='')
+
+    def __init__(self,
+        building: base.Component,
+        image_file: str = None
+    ):
+        super().__init__()
+        self.building = building
+        self.name = building.name
+        self.image_file = image_file
+        self.filter_name = building.name.lower()
+        self.filter_category = building.building_category.name
+        self.filter_availability = (building.availability.tier, building.availability.upgrade)
+
+
 class ComponentGrabEvent(object):
     '''
     Contains the state we need to remember in order to complete a drag-n-drop of a component.
     '''
 
+    __slots__ = ('component', 'geometry', 'pointer_position', 'attached_conveyance_geometries')
+
     def __init__(self,
         component: base.Component,              # What component is being dragged?
         geometry: geometry.ComponentGeometry,   # What does it look like when drawn?
         pointer_position: geometry.Coordinate2D,  # How far away is the pointer from the origin?
+        blueprint: drawing.Blueprint,           # Where do we find the geometry of other components?
     ):
         self.component = component
         self.geometry = geometry
         self.pointer_position = pointer_position
 
+        # When the component moves, we have to redraw any conveyances attached to it. Connections
+        # can't change during a drag, so find the geometry for those conveyances just once.
+        self.attached_conveyance_geometries = list()
+        for input in component.inputs:
+            if input.source:
+                conveyance = input.source.attached_to
+                if conveyance.is_conveyance and conveyance.inputs[0].source.attached_to:
+                    self.attached_conveyance_geometries.append(blueprint.geometry[conveyance.id])
+        for output in component.outputs:
+            if output.target:
+                conveyance = output.target.attached_to
+                if conveyance.is_conveyance and conveyance.outputs[0].target.attached_to:
+                    self.attached_conveyance_geometries.append(blueprint.geometry[conveyance.id])
+
+
+class IngredientListItem(GObject.Object):
+    '''
+    Wraps a line of ingredient data, such as "2.0x Iron Plate /m", so that it can be stored in a
+    Gio.ListStore and displayed by a list view.
+
+        - label: The text describing the ingredient
+        - image_file: Path to the image to display for the ingredient's item
+    '''
+
+    label = GObject.Property(type=str, default='')
+
+    def __init__(self,
+        label: str,
+        image_file: str = None
+    ):
+        super().__init__()
+        self.label = label
+        self.image_file = image_file
+
 
 class InteractionMode(Enum):
     '''
@@ -128,6 +269,35 @@ class PointerState(Enum):
     DOWN = 1
 
 
+class PortListItem(GObject.Object):
+    '''
+    Wraps one of a component's inputs or outputs so that it can be stored in a Gio.ListStore and
+    displayed as a row, along with a button to manage its connection, in a list view.
+
+        - component: The component the connection is attached to
+        - connection: The Input or Output itself
+        - connection_index: Where the connection is found in the component's inputs or outputs
+        - label: Text describing the ingredients flowing through the connection
+        - image_file: Path to the image of the first ingredient's item, if there is one
+    '''
+
+    label = GObject.Property(type=str, default='')
+
+    def __init__(self,
+        component: base.Component,
+        connection: base.Connection,
+        connection_index: int,
+        label: str,
+        image_file: str = None
+    ):
+        super().__init__()
+        self.component = component
+        self.connection = connection
+        self.connection_index = connection_index
+        self.label = label
+        self.image_file = image_file
+
+
 # Actual widgets follow here
 
 class FactoryDesignerWidget(Gtk.Widget):
@@ -142,17 +312,35 @@ class FactoryDesignerWidget(Gtk.Widget):
     ):
         super().__init__()
 
-        self.textures = {}  # Texture cache, to be populated as textures become necessary
+        self.textures = TEXTURES  # Texture cache shared by all widgets, filled in as needed
         self.blueprint = blueprint if blueprint else drawing.Blueprint()
         self.mode = InteractionMode.NORMAL  # Always start in the "normal" state of user interaction
         self.window = window  # Reference to the GTK Window containing this widget, allowing us to
                               # make calls back to its update_window function
 
+        # Don't let the theme decorate the canvas
+        install_designer_css(self.get_display())
+        self.add_css_class(DESIGNER_CSS_CLASS)
+
         # Mouse pointer state tracking
         self.pointer_down_at = None
+        self.pointer_dragged = False  # Has anything been moved since the button went down?
         self.pointer_state = PointerState.UP
         self.pointer_position = geometry.Coordinate2D()
 
+        # The render node for the last frame drawn, and the widget size it was drawn at
+        self.last_frame = None
+        self.last_frame_size = None
+
+        # While a component is dragged, everything else is drawn once into this render node and
+        # reused until the drag ends or the view changes
+        self.static_frame = None
+        self.static_frame_key = None
+
+        # Latest pointer position seen while dragging, applied once per frame by a tick callback
+        self.pending_motion = None
+        self.motion_tick_id = None
+
         # How far we zoom with each scroll event
         self.zoom_factor = 0.05
 
@@ -162,10 +350,13 @@ class FactoryDesignerWidget(Gtk.Widget):
         click_controller.connect('released', self.on_button_release)
         self.add_controller(click_controller)
 
-        motion_controller = Gtk.EventControllerMotion()
-        motion_controller.connect('motion', self.on_motion)
-        motion_controller.connect('leave', self.on_leave)
-        self.add_controller(motion_controller)
+        # The pointer's position is always tracked, but dragging is only handled while a button is
+        # down; on_button_press connects on_drag_motion and on_button_release disconnects it
+        self.motion_controller = Gtk.EventControllerMotion()
+        self.motion_controller.connect('motion', self.on_motion)
+        self.motion_controller.connect('leave', self.on_leave)
+        self.add_controller(self.motion_controller)
+        self.drag_motion_handler_id = None
 
         scroll_controller = Gtk.EventControllerScroll()
         scroll_controller.set_flags(Gtk.EventControllerScrollFlags.VERTICAL)
@@ -175,45 +366,99 @@ class FactoryDesignerWidget(Gtk.Widget):
         # Data structure used during click-n-drag operations, tracking the state of the motion
         self.component_grab_event = None
 
-        # A component created when user clicks "Build" and should be placed in the blueprint next
-        self.new_component = None
+        # Position of the selection among overlapping components when clicking cycles through them
+        self.selection_cycle_index = 0
+
+        # What to do with pointer motion during a drag in each interaction mode
+        self.motion_handlers = {
+            InteractionMode.NORMAL: self.__defer_motion,
+            InteractionMode.EXISTING_COMPONENT_SELECTED: self.__motion_selected,
+            InteractionMode.EXISTING_COMPONENT_GRABBED: self.__defer_motion,
+        }
 
     def load_texture(self,
         filename: str,
         category: str,
-        key: str,
+        key: Any,
     ) -> Gdk.Texture:
         '''
-        Loads an image into memory and stores it under the given key in the given category.
+        Loads an image into memory and stores it under the given key in the given category. The key
+        can be anything hashable, such as a name or the class the texture belongs to.
         '''
 
         texture = get_texture_from_file(filename)
-        if category not in self.textures.keys():
-            self.textures[category] = {}
-        self.textures[category][key] = texture
+        self.textures[(category, key)] = texture
         return texture
 
     def get_texture(self,
         category: str,
-        key: str
+        key: Any
     ) -> Gdk.Texture:
         '''
         Retrieves a texture from the cache, or returns None
         '''
 
-        if category in self.textures.keys() and key in self.textures[category]:
-            return self.textures[category][key]
-        return None
+        return self.textures.get((category, key))
 
     def do_snapshot(self,
         snapshot: Gtk.Snapshot
     ):
         '''
-        Draws the entire factory designer widget
+        Draws the entire factory designer widget. GTK also asks for a new snapshot when things like
+        the window's focus change, so if nothing has called `queue_draw` since the last frame and
+        the widget is the same size, the last frame's render node is reused instead.
+        '''
+
+        size = (self.get_width(), self.get_height())
+        if self.last_frame_size != size:
+            self.blueprint.viewport.region.size = drawing.Size2D(*size)
+            frame = Gtk.Snapshot.new()
+            if self.mode == InteractionMode.EXISTING_COMPONENT_GRABBED \
+                and self.component_grab_event is not None:
+                    self.__draw_grabbed_frame(frame, size)
+            else:
+                self.static_frame = None
+                self.static_frame_key = None
+                self.blueprint.draw_frame(self, frame)
+            self.last_frame = frame.to_node()
+            self.last_frame_size = size
+
+        if self.last_frame is not None:
+            snapshot.append_node(self.last_frame)
+
+    def __draw_grabbed_frame(self,
+        snapshot: Gtk.Snapshot,
+        size: tuple[int, int]
+    ):
+        '''
+        Draws a frame while a component is being dragged. Only the grabbed component and the
+        conveyances attached to it move, so everything else is drawn once at the start of the drag
+        and reused, with the moving parts drawn on top of it each frame.
+        '''
+
+        grab = self.component_grab_event
+        viewport = self.blueprint.viewport
+        key = (grab, viewport.scale, viewport.region.left, viewport.region.top, size)
+        if self.static_frame_key != key:
+            skip = { grab.component.id }
+            skip.update(geo.conveyance.id for geo in grab.attached_conveyance_geometries)
+            static = Gtk.Snapshot.new()
+            self.blueprint.draw_frame(self, static, skip=skip)
+            self.static_frame = static.to_node()
+            self.static_frame_key = key
+
+        if self.static_frame is not None:
+            snapshot.append_node(self.static_frame)
+        self.blueprint.draw_grabbed(
+            self, snapshot, grab.component, grab.attached_conveyance_geometries)
+
+    def queue_draw(self):
+        '''
+        Discards the last frame drawn so that the next snapshot draws the blueprint again.
         '''
 
-        self.blueprint.viewport.region.size = drawing.Size2D(self.get_width(), self.get_height())
-        self.blueprint.draw_frame(self, snapshot)
+        self.last_frame_size = None
+        super().queue_draw()
 
     def __update_selection(self,
         x: float,
@@ -236,20 +481,21 @@ class FactoryDesignerWidget(Gtk.Widget):
             self.blueprint.selected = components[0]
             self.mode = InteractionMode.EXISTING_COMPONENT_SELECTED
         elif len(components) > 1:
-            if self.blueprint.selected:
-                index = components.index(self.blueprint.selected)
-                if index < len(components) - 1:
-                    index += 1
-                else:
-                    index = 0
+            # Move on to the component after the selected one, or start over with the first one if
+            # the selected component isn't here. The last position we cycled to is usually still
+            # the selected one, so check it before searching for it.
+            selected = self.blueprint.selected
+            position = self.selection_cycle_index % len(components)
+            if components[position] is not selected:
+                position = next((i for i, component in enumerate(components)
+                    if component is selected), None)
+            if position is None:
+                self.selection_cycle_index = 0
             else:
-                index = 0
-            self.blueprint.selected = components[index]
+                self.selection_cycle_index = (position + 1) % len(components)
+            self.blueprint.selected = components[self.selection_cycle_index]
             self.mode = InteractionMode.EXISTING_COMPONENT_SELECTED
 
-        if self.blueprint.selected:
-            geo = self.blueprint.geometry.get(self.blueprint.selected.id)
-
     def on_leave(self, motion_controller):
         self.blueprint.pointer_position = None
 
@@ -259,6 +505,16 @@ class FactoryDesignerWidget(Gtk.Widget):
         x: float,
         y: float,
     ):
+        # If the user has chosen something to build, this click places it rather than selecting
+        if self.window.pending_build_class is not None:
+            scale = self.blueprint.viewport.scale
+            origin = self.blueprint.viewport.region.location
+            self.window.place_pending_build(geometry.Coordinate2D(
+                x / scale + origin.x,
+                y / scale + origin.y))
+            self.mode = InteractionMode.EXISTING_COMPONENT_SELECTED
+            return
+
         self.__update_selection(x, y)
         if self.blueprint.selected:
             self.mode = InteractionMode.EXISTING_COMPONENT_SELECTED
@@ -266,7 +522,11 @@ class FactoryDesignerWidget(Gtk.Widget):
             self.mode = InteractionMode.NORMAL
         self.pointer_state = PointerState.DOWN
         self.pointer_down_at = geometry.Coordinate2D(x, y)
-        self.queue_draw()
+        self.pointer_dragged = False
+        if self.drag_motion_handler_id is None:
+            self.drag_motion_handler_id = self.motion_controller.connect(
+                'motion', self.on_drag_motion)
+        # Updating the window queues a redraw of this widget, so there's no need to queue another
         self.window.update_window()
 
     def on_button_release(self,
@@ -275,6 +535,11 @@ class FactoryDesignerWidget(Gtk.Widget):
         x: float,
         y: float,
     ):
+        # Stop handling drags, but don't lose any motion that hasn't been applied by the next frame
+        if self.drag_motion_handler_id is not None:
+            self.motion_controller.disconnect(self.drag_motion_handler_id)
+            self.drag_motion_handler_id = None
+        self.apply_pending_motion()
         if self.blueprint.selected:
             self.mode = InteractionMode.EXISTING_COMPONENT_SELECTED
         else:
@@ -282,104 +547,169 @@ class FactoryDesignerWidget(Gtk.Widget):
         self.pointer_state = PointerState.UP
         self.pointer_down_at = None
         self.component_grab_event = None
-        self.queue_draw()
-        self.window.unsaved_changes = True
-        self.window.update_window()
+
+        # The press already updated the window for whatever got selected. Unless something was
+        # dragged since then, nothing has changed, and only a redraw is needed to finish the drag.
+        if self.pointer_dragged:
+            self.pointer_dragged = False
+            self.window.unsaved_changes = True
+            self.window.update_window()
+        else:
+            self.queue_draw()
 
     def on_motion(self,
         motion_controller: Gtk.EventControllerMotion,
         x: float,
         y: float,
     ):
-        redraw = False
-
-        self.pointer_position = geometry.Coordinate2D(x, y)
-
-        # If the mouse is moving and we've already got a component selected and the mouse button is
-        # down, then we have to move a component. Set the current grab event to start tracking it.
-        if self.mode == InteractionMode.EXISTING_COMPONENT_SELECTED:
-            if self.pointer_state == PointerState.DOWN \
-                and self.blueprint.selected \
-                and not isinstance(self.blueprint.selected, base.Conveyance):
-                    geo = self.blueprint.geometry[self.blueprint.selected.id]
-                    self.component_grab_event = ComponentGrabEvent(
-                        self.blueprint.selected,     # The selected component
-                        geo,                         # Geometry for the selected component
-                        geometry.Coordinate2D(x, y)  # Pixel location of the mouse event
-                    )
-                    self.mode = InteractionMode.EXISTING_COMPONENT_GRABBED
-                    redraw = True
-
-        # If the mouse is moving and a component has already been grabbed, then we have to move that
-        # component.
-        elif self.mode == InteractionMode.EXISTING_COMPONENT_GRABBED:
-            # Get the canvas location of the component
-            comp_x = self.component_grab_event.geometry.canvas_location.x
-            comp_y = self.component_grab_event.geometry.canvas_location.y
-
-            # Get the location of the original mousedown event
-            mousedown_x = self.component_grab_event.pointer_position.x
-            mousedown_y = self.component_grab_event.pointer_position.y
-
-            # Get the difference between the mousedown event and the current mouse position
-            offset_x = x - mousedown_x
-            offset_y = y - mousedown_y
-
-            # Convert that into a difference in canvas position
-            offset_x /= self.blueprint.viewport.scale
-            offset_y /= self.blueprint.viewport.scale
-
-            # Update the component's canvas_location and force recalculation of its geometry
-            self.component_grab_event.geometry.canvas_location = geometry.Coordinate2D(
-                comp_x + offset_x,
-                comp_y + offset_y
+        self.pointer_position.set(x, y)
+
+    def on_drag_motion(self,
+        motion_controller: Gtk.EventControllerMotion,
+        x: float,
+        y: float,
+    ):
+        '''
+        Handles pointer motion while a button is down. If nothing has been grabbed, we must be moving
+        the viewport.
+        '''
+
+        handler = self.motion_handlers.get(self.mode)
+        if handler:
+            handler(x, y)
+
+    def __motion_selected(self,
+        x: float,
+        y: float
+    ):
+        '''
+        If the mouse is moving and we've already got a component selected and the mouse button is
+        down, then we have to move a component. Set the current grab event to start tracking it.
+        '''
+
+        if self.blueprint.selected and not self.blueprint.selected.is_conveyance:
+            geo = self.blueprint.geometry[self.blueprint.selected.id]
+            self.component_grab_event = ComponentGrabEvent(
+                self.blueprint.selected,     # The selected component
+                geo,                         # Geometry for the selected component
+                geometry.Coordinate2D(x, y), # Pixel location of the mouse event
+                self.blueprint               # Blueprint holding the attached conveyances
+            )
+            self.mode = InteractionMode.EXISTING_COMPONENT_GRABBED
+            self.queue_draw()
+
+    def __defer_motion(self,
+        x: float,
+        y: float
+    ):
+        '''
+        If a component has been grabbed or the viewport is being dragged, the pointer can report
+        motion many times per frame. Only the latest position matters, so hold onto it and do the
+        work once, just before the next frame gets drawn.
+        '''
+
+        self.pending_motion = (x, y)
+        if self.motion_tick_id is None:
+            self.motion_tick_id = self.add_tick_callback(self.__on_motion_tick)
+
+    def __on_motion_tick(self,
+        widget: Gtk.Widget,
+        frame_clock: Gdk.FrameClock
+    ) -> bool:
+        '''
+        Runs once per frame while the pointer is dragging something, applying the latest motion.
+        '''
+
+        self.motion_tick_id = None
+        self.apply_pending_motion()
+        return GLib.SOURCE_REMOVE
+
+    def apply_pending_motion(self):
+        '''
+        Moves the grabbed component or the viewport to follow the most recent pointer position seen
+        by `on_motion`, if it hasn't been applied yet, and redraws the widget.
+        '''
+
+        if self.pending_motion is None:
+            return
+        x, y = self.pending_motion
+        self.pending_motion = None
+
+        # The viewport doesn't change while we're handling this motion, so read it once. Pixel
+        # distances are converted to canvas distances by multiplying by the inverse of the scale.
+        scale = self.blueprint.viewport.scale
+        inverse_scale = 1.0 / scale
+        translate = self.blueprint.viewport.region.location
+
+        # If a component has been grabbed, then we have to move that component.
+        if self.mode == InteractionMode.EXISTING_COMPONENT_GRABBED:
+            grab = self.component_grab_event
+            geo = grab.geometry
+
+            # Get the difference between the mousedown event and the current mouse position, then
+            # convert that into a difference in canvas position. As with panning, movement of less
+            # than half a pixel is left to add up with whatever motion comes next.
+            delta_x = x - grab.pointer_position.x
+            delta_y = y - grab.pointer_position.y
+            if abs(delta_x) < 0.5 and abs(delta_y) < 0.5:
+                return
+            offset_x = delta_x * inverse_scale
+            offset_y = delta_y * inverse_scale
+
+            # Update the component's canvas_location. Every piece of the component's geometry is
+            # offset from its rounded on-screen location, so if the geometry has already been
+            # calculated, moving it by the change in that location gives the same result as
+            # calculating it all again.
+            previous_left = round(geo.canvas_location.x * scale)
+            previous_top = round(geo.canvas_location.y * scale)
+            geo.canvas_location.set(
+                geo.canvas_location.x + offset_x,
+                geo.canvas_location.y + offset_y
             )
-            self.component_grab_event.geometry.calculate(
-                label_height=None,
-                label_width=None,
-                scale=self.blueprint.viewport.scale,
-                translate=self.blueprint.viewport.region.location)
+            if geo.label is None:
+                geo.calculate(
+                    label_height=None,
+                    label_width=None,
+                    scale=scale,
+                    translate=translate)
+            else:
+                geo.shift(
+                    round(geo.canvas_location.x * scale) - previous_left,
+                    round(geo.canvas_location.y * scale) - previous_top)
+            self.blueprint.hit_index = None
+            self.blueprint.canvas_index = None
 
             # Update the grab event's coordinates
-            self.component_grab_event.pointer_position = geometry.Coordinate2D(x, y)
+            grab.pointer_position.set(x, y)
+            self.pointer_dragged = True
 
             # When the component moves, we have to redraw any conveyances attached to it
-            for input in self.component_grab_event.component.inputs:
-                if input.source:
-                    if isinstance(input.source.attached_to, base.Conveyance):
-                        conv_src = input.source.attached_to.inputs[0].source.attached_to
-                        if conv_src:
-                            conv_geo = self.blueprint.geometry[input.source.attached_to.id]
-                            conv_geo.calculate(scale=self.blueprint.viewport.scale)
-            for output in self.component_grab_event.component.outputs:
-                if output.target:
-                    if isinstance(output.target.attached_to, base.Conveyance):
-                        conv_tgt = output.target.attached_to.outputs[0].target.attached_to
-                        if conv_tgt:
-                            conv_geo = self.blueprint.geometry[output.target.attached_to.id]
-                            conv_geo.calculate(scale=self.blueprint.viewport.scale)
-            redraw = True
-
-        # If the mouse moves and the mouse button is down, but we have not grabbed a component, then
-        # we must be moving the viewport.
+            for conveyance_geo in grab.attached_conveyance_geometries:
+                conveyance_geo.calculate(scale=scale)
+
+        # If the mouse button is down, but we have not grabbed a component, then we must be moving
+        # the viewport.
         elif self.pointer_state == PointerState.DOWN and self.mode == InteractionMode.NORMAL:
             # Determine the distance between where the mouse is now and where the pointer was last
-            # tracked. This is the distance we need to shift the viewport.
-            shift_x = (x - self.pointer_down_at.x) / self.blueprint.viewport.scale
-            shift_y = (y - self.pointer_down_at.y) / self.blueprint.viewport.scale
-            self.blueprint.viewport.region.location = geometry.Coordinate2D(
-                self.blueprint.viewport.region.left - shift_x,
-                self.blueprint.viewport.region.top - shift_y
-            )
+            # tracked. This is the distance we need to shift the viewport. If the pointer hasn't
+            # moved by at least half a pixel, nothing on screen would change, so leave the last
+            # tracked position alone and let the motion add up until it does.
+            delta_x = x - self.pointer_down_at.x
+            delta_y = y - self.pointer_down_at.y
+            if abs(delta_x) < 0.5 and abs(delta_y) < 0.5:
+                return
+            shift_x = delta_x * inverse_scale
+            shift_y = delta_y * inverse_scale
+            self.blueprint.pan(geometry.Coordinate2D(
+                translate.x - shift_x,
+                translate.y - shift_y
+            ))
 
             # Update the pointer position
-            self.pointer_down_at = geometry.Coordinate2D(x, y)
+            self.pointer_down_at.set(x, y)
+            self.pointer_dragged = True
 
-            # Force all geometry to be recalculated, then redraw the widget
-            self.blueprint.invalidate_geometry()
-            redraw = True
-
-        if redraw: self.queue_draw()
+        self.queue_draw()
 
     def on_scroll(self,
         scroll_controller: Gtk.EventControllerScroll,
@@ -420,9 +750,10 @@ class Taggable(object):
     '''
 
     def __init__(self,
-        tags: dict[str: str] = {}
+        tags: dict[str, str] = None
     ):
-        self.tags = tags
+        # Keep a copy, so tags set on this object never show up in a dict the caller still holds
+        self.tags = dict(tags) if tags else {}
 
     def set_tag(self,
         key: str,
@@ -438,9 +769,9 @@ class Taggable(object):
     def get_tag(self,
         key: str
     ) -> Any:
-        if key in self.tags.keys():
+        try:
             return self.tags[key]
-        else:
+        except KeyError:
             raise KeyError(f'Taggable object has no such key {key}')
 
 
@@ -450,7 +781,7 @@ class TaggableButton(Gtk.Button, Taggable):
     '''
 
     def __init__(self,
-        tags: dict[str: str] = {}
+        tags: dict[str, str] = None
     ):
         Gtk.Button.__init__(self)
         Taggable.__init__(self, tags=tags)
@@ -462,7 +793,7 @@ class TaggableEntryBuffer(Gtk.EntryBuffer, Taggable):
     '''
 
     def __init__(self,
-        tags: dict[str: str] = {}
+        tags: dict[str, str] = None
     ):
         Gtk.EntryBuffer.__init__(self)
         Taggable.__init__(self, tags=tags)
@@ -499,7 +830,8 @@ class TagBox(Gtk.Box):
         super().__init__(orientation=Gtk.Orientation.VERTICAL)
         self.callback = callback
         self.__component = component
-        self.__row_count = 0
+        self.__row_keys = []  # Tag keys shown in the grid, in the order of their rows
+        self.__row_buffers = {}  # Mapping of tag keys to their value buffers and signal handler IDs
 
         # Set up the outer box for packing
         self.set_halign(Gtk.Align.CENTER)
@@ -563,30 +895,41 @@ class TagBox(Gtk.Box):
 
     def repopulate(self):
         '''
-        Call this function sometime after calling __build to force the reconstruction of all widgets
-        which show component data.
+        Call this function sometime after calling __build to bring the widgets which show component
+        data up to date. Rows are kept for tags which are still present, so only the rows for tags
+        which have been added or removed get built or torn down.
         '''
 
-        # Remove all rows in the grid
-        for i in range(self.__row_count):
-            self.gridTags.remove_row(0)
-
-        if not self.component:
-            return
-
-        # Add a row for each key. We have to iterate over indices instead of typical dict iteration
-        # here because the indices are needed by the base class for row counting.
-        sorted_keys = sorted(self.component.tags)
-        for i in range(len(sorted_keys)):
-            # Extract the key and value
-            key = sorted_keys[i]
-            value = self.component.tags[sorted_keys[i]]
+        tags = self.component.tags if self.component else {}
+
+        # Remove the rows of tags which are gone, from the bottom up so the other rows' indices hold
+        for i in reversed(range(len(self.__row_keys))):
+            key = self.__row_keys[i]
+            if key not in tags:
+                self.gridTags.remove_row(i)
+                del self.__row_buffers[key]
+
+        # The remaining rows are already sorted, so inserting each new row at its place among the
+        # sorted keys puts everything in order
+        sorted_keys = sorted(tags)
+        for i, key in enumerate(sorted_keys):
+            value = tags[key]
+            if key in self.__row_buffers:
+                # Show the value for this component without treating that as an edit
+                bufferValue, handler_ids = self.__row_buffers[key]
+                if bufferValue.get_text() != value:
+                    for handler_id in handler_ids:
+                        bufferValue.handler_block(handler_id)
+                    bufferValue.set_text(value, -1)
+                    for handler_id in handler_ids:
+                        bufferValue.handler_unblock(handler_id)
+                continue
 
             # Create a row
             self.gridTags.insert_row(i)
 
             # Add the "remove" button
-            btnRemoveTag = TaggableButton(tags={'tag_key': key, 'row_id': i})
+            btnRemoveTag = TaggableButton(tags={'tag_key': key})
             btnRemoveTag.set_icon_name('list-remove')
             btnRemoveTag.connect('clicked', self.__btnRemoveTag_clicked)
 
@@ -599,9 +942,12 @@ class TagBox(Gtk.Box):
             entryValue = Gtk.Entry()
             bufferValue = TaggableEntryBuffer(tags={'tag_key': key})
             bufferValue.set_text(value, -1)
-            bufferValue.connect_after('deleted-text', self.__bufferValue_deleted)
-            bufferValue.connect_after('inserted-text', self.__bufferValue_inserted)
+            handler_ids = (
+                bufferValue.connect_after('deleted-text', self.__bufferValue_deleted),
+                bufferValue.connect_after('inserted-text', self.__bufferValue_inserted),
+            )
             entryValue.set_buffer(bufferValue)
+            self.__row_buffers[key] = (bufferValue, handler_ids)
 
             # Attach all these widgets to the grid. Function accepts these args in this order:
             #     (widget, column, row, width, height)
@@ -609,7 +955,7 @@ class TagBox(Gtk.Box):
             self.gridTags.attach(lblKey, 1, i, 1, 1)
             self.gridTags.attach(lblEquals, 2, i, 1, 1)
             self.gridTags.attach(entryValue, 3, i, 1, 1)
-        self.__row_count = len(sorted_keys)
+        self.__row_keys = sorted_keys
 
     def __btnNewTag_clicked(self, btn):
         key = self.entryNewTagKey.get_buffer().get_text()
@@ -620,7 +966,7 @@ class TagBox(Gtk.Box):
             dlgError.set_message('The tag name cannot be empty.')
             dlgError.choose(self)
             return
-        if key in self.component.tags.keys():
+        if key in self.component.tags:
             dlgError = Gtk.AlertDialog()
             dlgError.set_modal(True)
             dlgError.set_message(f'A tag called "{key}" already exists')
@@ -633,15 +979,15 @@ class TagBox(Gtk.Box):
         self.callback()
 
     def __btnRemoveTag_clicked(self, btn):
-        # The button is a TaggableButton containing the key of the removed tag and the row of the
-        # Grid that we need to remove.
+        # The button is a TaggableButton containing the key of the removed tag. Repopulating takes
+        # out just that tag's row.
         del(self.component.tags[btn.tags['tag_key']])
-        self.gridTags.remove_row(btn.tags['row_id'])
+        self.repopulate()
         self.callback()
 
     def __bufferValue_changed(self, key, value):
         self.component.tags[key] = value
-        callback()
+        self.callback()
 
     def __bufferValue_deleted(self, buffer, position, chars):
         self.__bufferValue_changed(buffer.tags['tag_key'], buffer.get_text())
@@ -31,6 +31,18 @@ def generate_id():
 
     return str(uuid4())
 
+def make_programmatic_name(source_str: str) -> str:
+    '''
+    Converts a user-friendly name into one which is usable as a Python identifier by title-casing it
+    and stripping out illegal characters.
+    '''
+
+    source_str = source_str.title()
+    illegal_chars = ' .'
+    for char in illegal_chars:
+        source_str = source_str.replace(char, '')
+    return source_str
+
 
 # Enums and helper classes go here
 
@@ -222,15 +234,20 @@ class Base(object):
         return f'{IMAGE_URL_BASE}{self.image_path}'
 
     def programmatic_name(self, source_str: str = None) -> str:
-        if not source_str:
-            source_str = self.name
+        '''
+        Returns a version of the given string (or this object's name) which can be used as a Python
+        identifier. The result for this object's own name is cached on the instance, keyed by the
+        name it was generated from, so that it only gets recalculated when the name changes.
+        '''
 
-        source_str = source_str.title()
-        illegal_chars = ' .'
-        for char in illegal_chars:
-            source_str = source_str.replace(char, '')
-        return source_str
+        if source_str:
+            return make_programmatic_name(source_str)
 
+        cached_name, cached_value = getattr(self, '_programmatic_name', (None, None))
+        if cached_name != self.name:
+            cached_name, cached_value = self.name, make_programmatic_name(self.name)
+            self._programmatic_name = (cached_name, cached_value)
+        return cached_value
 
     @property
     def wiki_url(self) -> str:
@@ -310,6 +327,12 @@ class Component(Base):
         - blueprint_top: The location of this component's top edge in a factory blueprint
     '''
 
+    # What kind of component this is. These are class-level constants, so checking one costs a
+    # single attribute lookup instead of an isinstance() walk through the class hierarchy.
+    is_conveyance = False
+    is_miner = False
+    is_resource_node = False
+
     def __init__(self,
         constructed: bool = False,
         traversed: bool = False,
@@ -825,6 +848,8 @@ class ResourceNode(Component):
             Ore instead.
     '''
 
+    is_resource_node = True
+
     def __init__(self,
         purity: Purity = Purity.NORMAL,
         wiki_path: str = '/Resource_Node',
@@ -1309,6 +1334,8 @@ class Conveyance(Building):
         - ingredients: The Items being conveyed.
     '''
 
+    is_conveyance = True
+
     def __init__(self,
         conveyance_type: ConveyanceType = ConveyanceType.BELT,
         rate: float = 0,
@@ -697,6 +697,8 @@ class Miner(Building):
     Typically, you would rather build an implementation of this class instead, like a MinerMk1.
     '''
 
+    is_miner = True
+
     def __init__(self,
         image_path: str = '/c/cf/Miner_Mk.1.png',
         wiki_path: str = '/Miner',
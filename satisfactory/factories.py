@@ -35,9 +35,20 @@ class Factory(Base):
     ):
         super().__init__(**kwargs)
         self._components = components
+        self._components_by_id = { component.id: component for component in components }
         self._errors = list()
         self.availability = availability
 
+    def __setstate__(self, state: dict):
+        '''
+        Restores a pickled factory. Factories saved before components were indexed by ID don't
+        carry that index, so it gets rebuilt here.
+        '''
+
+        self.__dict__.update(state)
+        if '_components_by_id' not in state:
+            self._components_by_id = { component.id: component for component in self._components }
+
     def to_dict(self) -> dict:
         '''
         Returns a dict representation of the object
@@ -81,10 +92,12 @@ class Factory(Base):
             if issubclass(type(component), Component):
                 component.factory = self
                 self._components.append(component)
+                self._components_by_id[component.id] = component
             if type(component) == list:
                 for comp in component:
                     comp.factory = self
                     self._components.append(comp)
+                    self._components_by_id[comp.id] = comp
 
     def remove(self,
         component_id: str
@@ -93,11 +106,22 @@ class Factory(Base):
         Removes the component with the given unique ID from the factory.
         '''
 
-        component = None
-        for component in self.components:
-            if component.id == component_id:
-                self.components.remove(component)
-                break
+        component = self._components_by_id.pop(component_id, None)
+        if component is not None:
+            self._components.remove(component)
+
+    def remove_many(self,
+        component_ids: set[str]
+    ):
+        '''
+        Removes all components with the given unique IDs from the factory in a single pass over the
+        component list.
+        '''
+
+        for component_id in component_ids:
+            self._components_by_id.pop(component_id, None)
+        self._components[:] = [ component for component in self._components
+            if component.id not in component_ids ]
 
     def add_error(self,
         error: ComponentError
@@ -211,10 +235,7 @@ class Factory(Base):
         Returns a specific single Component, given its unique ID.
         '''
 
-        for component in self._components:
-            if component.id == id:
-                return component
-        return None
+        return self._components_by_id.get(id)
 
     def get_components_by_name(self,
         name: str,
@@ -300,8 +321,10 @@ class Factory(Base):
             - filename: The path to the factory file
         '''
 
+        # Read the whole file in one go and unpickle it from memory rather than letting pickle pull
+        # it through the file object in many small reads
         with open(filename, 'rb') as fh:
-            factory = pickle.load(fh)
+            factory = pickle.loads(fh.read())
 
         return factory
 
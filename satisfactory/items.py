@@ -9,6 +9,7 @@ Here are defined all of the items we care about.
 '''
 
 ALL = None
+BY_NAME = None
 
 def get_all():
     '''
@@ -22,6 +23,17 @@ def get_all():
             if isinstance(mbr[1], Item) ]
     return ALL
 
+def get_by_name(name: str) -> Item | None:
+    '''
+    Returns the Item with the given name as it is defined in this module, or None if there isn't
+    one; builds a lookup table on first use for quick access.
+    '''
+
+    global BY_NAME
+    if BY_NAME is None:
+        BY_NAME = dict(get_all())
+    return BY_NAME.get(name)
+
 def get_all_unlockable():
     '''
     Returns a list of all Items which are unlockable through the MAM
@@ -103,6 +103,7 @@ Here are defined every recipe we care about
 '''
 
 ALL = None
+BY_NAME = None
 
 def get_all():
     '''
@@ -116,6 +117,17 @@ def get_all():
             if isinstance(mbr[1], Recipe) ]
     return ALL
 
+def get_by_name(name: str) -> Recipe | None:
+    '''
+    Returns the Recipe with the given name as it is defined in this module, or None if there isn't
+    one; builds a lookup table on first use for quick access.
+    '''
+
+    global BY_NAME
+    if BY_NAME is None:
+        BY_NAME = dict(get_all())
+    return BY_NAME.get(name)
+
 def get_all_unlockable():
     '''
     Returns a list of all recipes unlockable through the MAM